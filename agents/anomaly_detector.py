@@ -3,15 +3,132 @@ AnomalyDetector Agent for DevOps AI Platform.
 
 This agent detects anomalies in infrastructure metrics and provides
 alerts and recommendations for unusual patterns.
+
+Each entry of ``metrics_data`` may be given in either of two layouts:
+
+- a list of samples, e.g. ``[{"value": 42.0, "timestamp": "..."}, ...]``
+- a dict of parallel arrays, e.g. ``{"values": ndarray, "timestamps": [...]}``
+
+The array layout is used without per-sample conversion, so producers that
+already hold numeric arrays should prefer it.
 """
 
+import threading
+
 import numpy as np
-from typing import Dict, Any, List
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 
 from agents.base import BaseAgent, AgentType, AgentContext, AgentResult
+from agents.kernels import bocpd_baseline, zscore_outliers, warm_up
 from core.config import Settings
 
 
+# Recommendation and action templates are built once and shared; only the
+# per-call fields are filled in by the agent
+_HIGH_SEVERITY_RECOMMENDATION = {
+    "title": "High Severity Anomalies Detected",
+    "priority": "high",
+    "impact": "performance_degradation",
+    "actions": (
+        "Investigate root cause immediately",
+        "Check system health",
+        "Review recent changes"
+    )
+}
+
+_MEDIUM_SEVERITY_RECOMMENDATION = {
+    "title": "Medium Severity Anomalies Detected",
+    "priority": "medium",
+    "impact": "monitoring_required",
+    "actions": (
+        "Monitor trends",
+        "Check for patterns",
+        "Update alerting thresholds"
+    )
+}
+
+# The alerting analysis does not depend on the config contents yet
+_ALERTING_RECOMMENDATIONS = (
+    {
+        "title": "Optimize Alerting Thresholds",
+        "description": "Adjust thresholds based on anomaly patterns",
+        "priority": "medium",
+        "impact": "reduced_false_positives"
+    },
+)
+
+_ALERTING_ACTIONS = (
+    {
+        "title": "Update Alerting Configuration",
+        "description": "Optimize alerting thresholds and rules",
+        "resource": "alertmanager",
+        "change": {
+            "action": "update_thresholds",
+            "severity": "medium"
+        },
+        "priority": "medium",
+        "estimated_impact": "reduced_false_positives"
+    },
+)
+
+
+def _mean_std(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute row-wise mean and population standard deviation together.
+    
+    Sum and sum of squares are accumulated over the data shifted by each
+    row's first sample, which keeps the sum-of-squares formula numerically
+    stable without the extra mean pass that calling ``np.mean`` and
+    ``np.std`` performs. Reductions accumulate in float64 whatever the
+    storage dtype.
+    """
+    n = values.shape[1]
+    shifted = values - values[:, :1]
+    total = shifted.sum(axis=1, dtype=np.float64)
+    sum_sq = np.einsum("ij,ij->i", shifted, shifted, dtype=np.float64)
+    mean = values[:, 0].astype(np.float64) + total / n
+    variance = np.maximum(sum_sq / n - (total / n) ** 2, 0.0)
+    return mean, np.sqrt(variance)
+
+
+class BOCPDDetector:
+    """
+    Bayesian online change point detection with run-length pruning.
+    
+    Uses a Normal-Gamma prior, so each run length has a Student-t predictive
+    distribution, and a constant hazard of ``1 / hazard_lambda``. Run lengths
+    with negligible posterior mass are pruned, which keeps the cost linear in
+    the series length.
+    """
+    
+    def __init__(self, hazard_lambda: float = 250.0, prune_threshold: float = 1e-4):
+        self.hazard_lambda = hazard_lambda
+        self.prune_threshold = prune_threshold
+    
+    def baseline(self, values: np.ndarray, mean: float, std: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the regime-aware predictive center and scale for each sample.
+        
+        Args:
+            values: 1-D series of samples
+            mean: Global mean used as the prior mean
+            std: Global standard deviation used to scale the prior
+            
+        Returns:
+            Tuple of per-sample center and scale
+        """
+        return bocpd_baseline(
+            values,
+            mean,
+            1.0,
+            1.0,
+            std * std,
+            1.0 / self.hazard_lambda,
+            self.prune_threshold
+        )
+
+
 class AnomalyDetectorAgent(BaseAgent):
     """
     AnomalyDetector agent for detecting infrastructure anomalies.
@@ -20,10 +137,24 @@ class AnomalyDetectorAgent(BaseAgent):
     metrics and provides alerts and recommendations.
     """
     
+    # Scans are synchronous NumPy work, so the registry runs this agent on
+    # its thread pool
+    is_blocking = True
+    
     def __init__(self, settings: Settings):
         super().__init__(AgentType.ANOMALY_DETECTOR, settings)
         self.anomaly_threshold = 2.0  # Standard deviations
+        self.window_size = 30  # Samples in the rolling baseline
+        self.bocpd_min_points = 50  # Shorter series use the rolling z-score
+        self.change_point_detector = BOCPDDetector()
         self.confidence_threshold = 0.8
+        
+        # Reusable float32 buffer backing the per-group scan matrices; one per
+        # thread, because executions may run on several pool threads at once
+        self._scratch = threading.local()
+        
+        # Compile this agent's kernels now rather than on the first scan
+        warm_up(zscore_outliers, bocpd_baseline)
     
     def _get_description(self) -> str:
         """Get agent description."""
@@ -31,168 +162,273 @@ class AnomalyDetectorAgent(BaseAgent):
     
     async def analyze(self, context: AgentContext) -> AgentResult:
         """Analyze metrics for anomalies."""
-        try:
-            metrics_data = context.metrics_data
-            
-            if not metrics_data:
-                return AgentResult(
-                    success=False,
-                    data={},
-                    recommendations=[],
-                    actions=[],
-                    error_message="No metrics data available"
-                )
-            
-            # Detect anomalies in different metric types
-            anomalies = self._detect_anomalies(metrics_data)
-            
-            # Generate recommendations
-            recommendations = self._generate_anomaly_recommendations(anomalies)
-            
-            return AgentResult(
-                success=True,
-                data={
-                    "anomalies": anomalies,
-                    "metrics_analyzed": len(metrics_data)
-                },
-                recommendations=recommendations,
-                actions=[]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in anomaly detection: {e}")
+        metrics_data = context.metrics_data
+        
+        if not metrics_data:
             return AgentResult(
                 success=False,
                 data={},
                 recommendations=[],
                 actions=[],
-                error_message=f"Anomaly detection failed: {str(e)}"
+                error_message="No metrics data available"
             )
+        
+        # Detect anomalies in different metric types
+        anomalies, high_count, medium_count = self._scan_metrics(metrics_data)
+        
+        # Generate recommendations
+        recommendations = self._generate_anomaly_recommendations(high_count, medium_count)
+        
+        return AgentResult(
+            success=True,
+            data={
+                "anomalies": anomalies,
+                "metrics_analyzed": len(metrics_data)
+            },
+            recommendations=recommendations,
+            actions=[]
+        )
     
     async def optimize(self, context: AgentContext) -> AgentResult:
         """Generate optimization recommendations for anomaly handling."""
-        try:
-            # Get current alerting configuration
-            infrastructure_data = context.infrastructure_data
-            alerting_config = infrastructure_data.get("alerting", {})
-            
-            # Analyze alerting effectiveness
-            alerting_analysis = self._analyze_alerting_config(alerting_config)
-            
-            # Generate optimization actions
-            actions = self._generate_alerting_actions(alerting_analysis)
-            
-            return AgentResult(
-                success=True,
-                data={
-                    "alerting_analysis": alerting_analysis,
-                    "current_config": alerting_config
-                },
-                recommendations=[],
-                actions=actions
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in anomaly optimization: {e}")
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message=f"Anomaly optimization failed: {str(e)}"
-            )
+        # Get current alerting configuration
+        infrastructure_data = context.infrastructure_data
+        alerting_config = infrastructure_data.get("alerting", {})
+        
+        # Analyze alerting effectiveness
+        alerting_analysis = self._analyze_alerting_config(alerting_config)
+        
+        # Generate optimization actions
+        actions = self._generate_alerting_actions(alerting_analysis)
+        
+        return AgentResult(
+            success=True,
+            data={
+                "alerting_analysis": alerting_analysis,
+                "current_config": alerting_config
+            },
+            recommendations=[],
+            actions=actions
+        )
     
     def _detect_anomalies(self, metrics_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect anomalies in metrics data."""
+        return self._scan_metrics(metrics_data)[0]
+    
+    def _scan_metrics(self, metrics_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Detect anomalies and count them by severity.
+        
+        Returns:
+            Tuple of anomaly details, high-severity count and medium-severity count
+        """
         anomalies = []
+        high_count = 0
+        medium_count = 0
         
+        # Group series by length so each group is scored as one 2-D matrix
+        buckets: Dict[int, List[Tuple[str, Any, Optional[Sequence]]]] = {}
         for metric_name, metric_values in metrics_data.items():
-            if isinstance(metric_values, list) and len(metric_values) > 10:
-                values = [v.get("value", 0) for v in metric_values if isinstance(v, dict)]
-                
-                if values:
-                    mean_val = np.mean(values)
-                    std_val = np.std(values)
-                    
-                    if std_val > 0:
-                        # Check for anomalies
-                        for i, value in enumerate(values):
-                            z_score = abs((value - mean_val) / std_val)
-                            
-                            if z_score > self.anomaly_threshold:
-                                anomalies.append({
-                                    "metric": metric_name,
-                                    "value": value,
-                                    "expected_range": [mean_val - 2*std_val, mean_val + 2*std_val],
-                                    "z_score": z_score,
-                                    "severity": "high" if z_score > 3 else "medium",
-                                    "timestamp": metric_values[i].get("timestamp") if i < len(metric_values) else None
-                                })
-        
-        return anomalies
-    
-    def _generate_anomaly_recommendations(self, anomalies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate recommendations based on detected anomalies."""
-        recommendations = []
+            series = self._normalize_series(metric_values)
+            if series is not None:
+                source, timestamps = series
+                buckets.setdefault(len(source), []).append((metric_name, source, timestamps))
         
-        if anomalies:
-            high_severity = [a for a in anomalies if a["severity"] == "high"]
-            medium_severity = [a for a in anomalies if a["severity"] == "medium"]
+        for length, group in buckets.items():
+            # Metric samples carry a few significant digits, so float32 storage
+            # halves memory traffic without affecting detection
+            values = self._scratch_matrix(len(group), length)
+            for row, (_, source, _) in enumerate(group):
+                if isinstance(source, np.ndarray):
+                    values[row] = source
+                else:
+                    values[row] = np.fromiter(
+                        (v.get("value", 0) for v in source),
+                        dtype=np.float32,
+                        count=length
+                    )
             
-            if high_severity:
-                recommendations.append({
-                    "title": "High Severity Anomalies Detected",
-                    "description": f"Found {len(high_severity)} high-severity anomalies requiring immediate attention",
-                    "priority": "high",
-                    "impact": "performance_degradation",
-                    "actions": [
-                        "Investigate root cause immediately",
-                        "Check system health",
-                        "Review recent changes"
-                    ]
-                })
+            mean_vals, std_vals = _mean_std(values)
+            
+            # Flat series cannot have z-score outliers
+            active = np.flatnonzero(std_vals > 0)
+            if active.size == 0:
+                continue
+            if active.size < len(group):
+                group = [group[row] for row in active.tolist()]
+                values = values[active]
+                mean_vals = mean_vals[active]
+                std_vals = std_vals[active]
+            
+            if length >= self.bocpd_min_points:
+                center, scale = self._change_point_baseline(values, mean_vals, std_vals)
+            else:
+                center, scale = self._rolling_baseline(values, mean_vals, std_vals)
+            
+            # Compare raw deviations against threshold * scale; z-scores are
+            # only divided out for the outliers that get reported
+            rows, cols, z_scores = zscore_outliers(
+                values, center, scale, self.anomaly_threshold
+            )
+            
+            # Classify severity for the whole group in one comparison
+            high_mask = z_scores > 3
+            group_high = int(np.count_nonzero(high_mask))
+            high_count += group_high
+            medium_count += z_scores.size - group_high
             
-            if medium_severity:
-                recommendations.append({
-                    "title": "Medium Severity Anomalies Detected",
-                    "description": f"Found {len(medium_severity)} medium-severity anomalies to monitor",
-                    "priority": "medium",
-                    "impact": "monitoring_required",
-                    "actions": [
-                        "Monitor trends",
-                        "Check for patterns",
-                        "Update alerting thresholds"
-                    ]
+            for row, col, z_score, is_high in zip(
+                rows.tolist(), cols.tolist(), z_scores.tolist(), high_mask.tolist()
+            ):
+                metric_name, source, timestamps = group[row]
+                low = float(center[row, col] - 2 * scale[row, col])
+                high = float(center[row, col] + 2 * scale[row, col])
+                anomalies.append({
+                    "metric": metric_name,
+                    "value": self._sample_value(source, col),
+                    "expected_range": [low, high],
+                    "z_score": z_score,
+                    "severity": "high" if is_high else "medium",
+                    "timestamp": self._sample_timestamp(source, timestamps, col)
                 })
         
+        return anomalies, high_count, medium_count
+    
+    def _scratch_matrix(self, rows: int, cols: int) -> np.ndarray:
+        """
+        Get a ``rows x cols`` float32 view over this thread's scratch buffer.
+        
+        The buffer grows geometrically and is reused across scans, so steady
+        state monitoring does not allocate a new matrix per tick. The view is
+        only valid until the next call on the same thread.
+        """
+        size = rows * cols
+        buffer: Optional[np.ndarray] = getattr(self._scratch, "buffer", None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size * 2, dtype=np.float32)
+            self._scratch.buffer = buffer
+        return buffer[:size].reshape(rows, cols)
+    
+    def _normalize_series(
+        self,
+        metric_values: Any
+    ) -> Optional[Tuple[Union[np.ndarray, List[Dict[str, Any]]], Optional[Sequence]]]:
+        """
+        Normalize one metric entry for scanning.
+        
+        Returns:
+            Tuple of the value source (float array or list of sample dicts) and
+            the parallel timestamps for array input, or None if the series is
+            too short or not in a supported layout
+        """
+        if isinstance(metric_values, dict) and "values" in metric_values:
+            values = np.asarray(metric_values["values"])
+            if values.ndim == 1 and values.size > 10 and values.dtype.kind in "biuf":
+                return values, metric_values.get("timestamps")
+            return None
+        
+        if isinstance(metric_values, list) and len(metric_values) > 10:
+            if all(isinstance(v, dict) for v in metric_values):
+                samples = metric_values
+            else:
+                samples = [v for v in metric_values if isinstance(v, dict)]
+            if samples:
+                return samples, None
+        
+        return None
+    
+    @staticmethod
+    def _sample_value(source: Any, index: int) -> float:
+        """Look up the original value of one sample in either series layout."""
+        if isinstance(source, list):
+            return float(source[index].get("value", 0))
+        return float(source[index])
+    
+    @staticmethod
+    def _sample_timestamp(source: Any, timestamps: Optional[Sequence], index: int) -> Any:
+        """Look up the timestamp of one sample in either series layout."""
+        if isinstance(source, list):
+            return source[index].get("timestamp")
+        if timestamps is None or index >= len(timestamps):
+            return None
+        timestamp = timestamps[index]
+        return timestamp.item() if isinstance(timestamp, np.generic) else timestamp
+    
+    def _rolling_baseline(
+        self,
+        values: np.ndarray,
+        mean_vals: np.ndarray,
+        std_vals: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build per-sample baseline mean and standard deviation.
+        
+        Each sample is compared against the ``window_size`` samples preceding
+        it in its row, so trending metrics are judged against their recent
+        level. The first window, and any flat window, falls back to the
+        row's global stats.
+        """
+        length = values.shape[1]
+        window = self.window_size
+        center = np.repeat(mean_vals[:, None], length, axis=1)
+        scale = np.repeat(std_vals[:, None], length, axis=1)
+        
+        if length > window:
+            windows = sliding_window_view(values[:, :-1], window, axis=1)
+            center[:, window:] = windows.mean(axis=2, dtype=np.float64)
+            window_std = windows.std(axis=2, dtype=np.float64)
+            scale[:, window:] = np.where(window_std > 0, window_std, std_vals[:, None])
+        
+        return center, scale
+    
+    def _change_point_baseline(
+        self,
+        values: np.ndarray,
+        mean_vals: np.ndarray,
+        std_vals: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build per-sample baselines from BOCPD run-length posteriors.
+        
+        Long series are judged against the regime they are currently in, so
+        level shifts re-baseline quickly instead of flagging every later point.
+        """
+        center = np.empty(values.shape, dtype=np.float64)
+        scale = np.empty(values.shape, dtype=np.float64)
+        detector = self.change_point_detector
+        for row in range(values.shape[0]):
+            center[row], scale[row] = detector.baseline(
+                values[row], float(mean_vals[row]), float(std_vals[row])
+            )
+        return center, scale
+    
+    def _generate_anomaly_recommendations(self, high_count: int, medium_count: int) -> List[Dict[str, Any]]:
+        """Generate recommendations based on detected anomaly counts."""
+        recommendations = []
+        
+        if high_count:
+            recommendations.append({
+                **_HIGH_SEVERITY_RECOMMENDATION,
+                "description": f"Found {high_count} high-severity anomalies requiring immediate attention"
+            })
+        
+        if medium_count:
+            recommendations.append({
+                **_MEDIUM_SEVERITY_RECOMMENDATION,
+                "description": f"Found {medium_count} medium-severity anomalies to monitor"
+            })
+        
         return recommendations
     
     def _analyze_alerting_config(self, alerting_config: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze current alerting configuration."""
         return {
             "current_config": alerting_config,
-            "recommendations": [
-                {
-                    "title": "Optimize Alerting Thresholds",
-                    "description": "Adjust thresholds based on anomaly patterns",
-                    "priority": "medium",
-                    "impact": "reduced_false_positives"
-                }
-            ]
+            "recommendations": [dict(recommendation) for recommendation in _ALERTING_RECOMMENDATIONS]
         }
     
     def _generate_alerting_actions(self, alerting_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate alerting optimization actions."""
-        return [
-            {
-                "title": "Update Alerting Configuration",
-                "description": "Optimize alerting thresholds and rules",
-                "resource": "alertmanager",
-                "change": {
-                    "action": "update_thresholds",
-                    "severity": "medium"
-                },
-                "priority": "medium",
-                "estimated_impact": "reduced_false_positives"
-            }
-        ]
+        # Fresh dicts per call so a caller editing one result cannot change
+        # the templates or any other result
+        return [{**action, "change": dict(action["change"])} for action in _ALERTING_ACTIONS]
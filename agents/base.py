@@ -6,15 +6,32 @@ with common functionality and interfaces.
 """
 
 import asyncio
+import sys
 import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+
+import numpy as np
+import orjson
 
 from core.logging import LoggerMixin
 from core.config import Settings
 
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values orjson cannot encode natively."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
 
 class AgentStatus(Enum):
     """Agent status enumeration."""
@@ -36,7 +53,7 @@ class AgentType(Enum):
     LOAD_SHIFTER = "load_shifter"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentContext:
     """Context information for agent execution."""
     infrastructure_data: Dict[str, Any]
@@ -48,7 +65,7 @@ class AgentContext:
     timestamp: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResult:
     """Result of agent execution."""
     success: bool
@@ -57,6 +74,21 @@ class AgentResult:
     actions: List[Dict[str, Any]]
     error_message: Optional[str] = None
     execution_time: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the result as a plain dictionary (shallow, no copies)."""
+        return {
+            "success": self.success,
+            "data": self.data,
+            "recommendations": self.recommendations,
+            "actions": self.actions,
+            "error_message": self.error_message,
+            "execution_time": self.execution_time
+        }
+    
+    def to_json(self) -> bytes:
+        """Serialize the result to JSON bytes."""
+        return orjson.dumps(self.to_dict(), default=_json_default, option=_JSON_OPTIONS)
 
 
 class BaseAgent(ABC, LoggerMixin):
@@ -67,6 +99,10 @@ class BaseAgent(ABC, LoggerMixin):
     context handling, and result processing.
     """
     
+    # Agents whose execution does CPU-bound or synchronous work set this so
+    # the registry runs them on its thread pool instead of the event loop
+    is_blocking = False
+    
     def __init__(self, agent_type: AgentType, settings: Settings):
         self.agent_type = agent_type
         self.settings = settings
@@ -82,14 +118,14 @@ class BaseAgent(ABC, LoggerMixin):
         
         self.logger.info(f"Initialized {self.agent_type.value} agent")
     
-    @property
+    @cached_property
     def name(self) -> str:
-        """Get agent name."""
+        """Get agent name (computed once per instance)."""
         return self.agent_type.value
     
-    @property
+    @cached_property
     def description(self) -> str:
-        """Get agent description."""
+        """Get agent description (computed once per instance)."""
         return self._get_description()
     
     @abstractmethod
@@ -142,18 +178,23 @@ class BaseAgent(ABC, LoggerMixin):
                 error_message="Agent is disabled"
             )
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         self.status = AgentStatus.RUNNING
         self.execution_count += 1
         
         try:
             self.logger.info(f"Starting {self.name} execution")
             
-            # Perform analysis
-            analysis_result = await self.analyze(context)
-            
-            # Generate optimizations
-            optimization_result = await self.optimize(context)
+            # Analysis and optimization read the same context independently,
+            # so run them concurrently and overlap any I/O they do
+            analysis_result, optimization_result = await asyncio.gather(
+                self.analyze(context),
+                self.optimize(context),
+                return_exceptions=True
+            )
+            for outcome in (analysis_result, optimization_result):
+                if isinstance(outcome, BaseException):
+                    raise outcome
             
             # Combine results
             result = AgentResult(
@@ -162,9 +203,9 @@ class BaseAgent(ABC, LoggerMixin):
                     "analysis": analysis_result.data,
                     "optimization": optimization_result.data
                 },
-                recommendations=analysis_result.recommendations + optimization_result.recommendations,
-                actions=analysis_result.actions + optimization_result.actions,
-                execution_time=time.time() - start_time
+                recommendations=[*analysis_result.recommendations, *optimization_result.recommendations],
+                actions=[*analysis_result.actions, *optimization_result.actions],
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9
             )
             
             # Update performance metrics
@@ -179,7 +220,8 @@ class BaseAgent(ABC, LoggerMixin):
         except Exception as e:
             self.error_count += 1
             self.status = AgentStatus.ERROR
-            self.logger.error(f"Error in {self.name} execution: {e}")
+            # logger.exception defers traceback formatting to the log backend
+            self.logger.exception(f"Error in {self.name} execution")
             
             return AgentResult(
                 success=False,
@@ -187,11 +229,11 @@ class BaseAgent(ABC, LoggerMixin):
                 recommendations=[],
                 actions=[],
                 error_message=str(e),
-                execution_time=time.time() - start_time
+                execution_time=(time.perf_counter_ns() - start_ns) * 1e-9
             )
     
     def _update_performance_metrics(self, execution_time: float) -> None:
-        """Update agent performance metrics."""
+        """Update agent performance metrics (wall-clock seconds per execution)."""
         self.total_execution_time += execution_time
         self.avg_execution_time = self.total_execution_time / self.execution_count
     
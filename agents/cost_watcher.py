@@ -5,14 +5,116 @@ This agent monitors cloud costs and provides optimization recommendations
 to reduce infrastructure spending.
 """
 
+import asyncio
 import boto3
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+import heapq
+import numpy as np
+import time
+from botocore.exceptions import ClientError
+from collections import defaultdict
+from operator import itemgetter
+from typing import Callable, DefaultDict, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+from datetime import date, timedelta
 
 from agents.base import BaseAgent, AgentType, AgentContext, AgentResult
 from core.config import Settings
 
 
+_T = TypeVar("_T")
+
+# The only Cost Explorer metric requested; every extra metric adds a parsed
+# amount to each group in the response
+_COST_METRIC = "UnblendedCost"
+
+
+class _OptimizationRule(NamedTuple):
+    """A service whose spend above a share of the alert threshold is worth optimizing."""
+    
+    service_key: str
+    service_name: str
+    opportunity_type: str
+    threshold_fraction: float
+    savings_fraction: float
+    priority: str
+    description: str
+
+
+_OPTIMIZATION_RULES = (
+    _OptimizationRule("AmazonEC2", "EC2", "idle_resources", 0.3, 0.2, "medium",
+                      "Consider stopping idle EC2 instances"),
+    _OptimizationRule("AmazonS3", "S3", "storage_optimization", 0.2, 0.15, "low",
+                      "Consider S3 lifecycle policies and storage class optimization"),
+    _OptimizationRule("AmazonRDS", "RDS", "database_optimization", 0.25, 0.25, "medium",
+                      "Consider RDS instance optimization and reserved instances"),
+    _OptimizationRule("AWS Data Transfer", "Data Transfer", "data_transfer_optimization", 0.1, 0.3, "high",
+                      "Optimize data transfer patterns and use CloudFront"),
+)
+
+# Rule columns as arrays so all thresholds are checked in a single pass
+_RULE_SERVICE_KEYS = tuple(rule.service_key for rule in _OPTIMIZATION_RULES)
+_RULE_THRESHOLD_FRACTIONS = np.array([rule.threshold_fraction for rule in _OPTIMIZATION_RULES])
+_RULE_SAVINGS_FRACTIONS = np.array([rule.savings_fraction for rule in _OPTIMIZATION_RULES])
+
+_BUDGET_EXCEEDED_RECOMMENDATION = {
+    "title": "Budget Exceeded",
+    "priority": "high",
+    "impact": "cost_reduction",
+    "actions": (
+        "Review and stop unnecessary resources",
+        "Implement cost alerts",
+        "Consider reserved instances"
+    )
+}
+
+_HIGH_SPENDING_RECOMMENDATION = {
+    "title": "High Spending Alert",
+    "priority": "medium",
+    "impact": "cost_reduction",
+    "actions": (
+        "Analyze spending patterns",
+        "Identify optimization opportunities",
+        "Implement cost controls"
+    )
+}
+
+_INCREASING_TREND_RECOMMENDATION = {
+    "title": "Increasing Cost Trend",
+    "description": "Costs are trending upward, consider proactive optimization",
+    "priority": "medium",
+    "impact": "cost_control",
+    "actions": (
+        "Monitor cost trends",
+        "Implement cost controls",
+        "Review resource usage"
+    )
+}
+
+# Downsizing targets as (CPU utilization upper bound, instance type), smallest first
+_EC2_SIZE_SUGGESTIONS = ((0.2, "t3.micro"), (0.4, "t3.small"))
+_RDS_SIZE_SUGGESTIONS = ((0.2, "db.t3.micro"), (0.4, "db.t3.small"))
+
+# Recommendation titles for each opportunity type, built once
+_OPPORTUNITY_TITLES = {
+    rule.opportunity_type: f"{rule.opportunity_type.replace('_', ' ').title()} Opportunity"
+    for rule in _OPTIMIZATION_RULES
+}
+
+
+def _suggest_size(suggestions: Tuple[Tuple[float, str], ...], current_type: str, cpu_util: float) -> str:
+    """Pick the first suggested type whose utilization bound exceeds ``cpu_util``."""
+    if "t3" in current_type:
+        return current_type
+    for bound, suggested_type in suggestions:
+        if cpu_util < bound:
+            return suggested_type
+    return current_type
+
+
+def _daily_cost_array(daily_costs: List[Dict[str, Any]]) -> np.ndarray:
+    """Collect the ``cost`` of each daily entry into a float64 array."""
+    return np.fromiter((day["cost"] for day in daily_costs), dtype=np.float64, count=len(daily_costs))
+
+
 class CostWatcherAgent(BaseAgent):
     """
     CostWatcher agent for cost monitoring and optimization.
@@ -25,6 +127,26 @@ class CostWatcherAgent(BaseAgent):
         super().__init__(AgentType.COST_WATCHER, settings)
         self.cost_threshold = settings.aws_cost_alert_threshold
         self.optimization_threshold = 0.1  # 10% potential savings
+        
+        # Cost Explorer data only refreshes a few times a day and every request
+        # is billed, so processed responses are reused for an hour
+        self.cost_cache_ttl = 3600.0  # seconds
+        self._cost_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+        self._inflight_fetches: Dict[Tuple[Any, ...], "asyncio.Future[Dict[str, Any]]"] = {}
+        
+        # Per-service drill-down queries run concurrently, bounded to stay
+        # under Cost Explorer's request rate
+        self.max_concurrent_queries = 8
+        self.max_query_attempts = 4
+        
+        # Building a boto3 client loads service models and resolves endpoints,
+        # so one client is created on first use and reused
+        self._ce_client: Optional[Any] = None
+        
+        # The 30-day query window only moves once a day, so it is recomputed
+        # at most once a minute rather than reading the wall clock every call
+        self._cost_window_ttl = 60.0  # seconds
+        self._cost_window_entry: Optional[Tuple[float, date, date]] = None
     
     def _get_description(self) -> str:
         """Get agent description."""
@@ -57,8 +179,11 @@ class CostWatcherAgent(BaseAgent):
                     error_message="No cost data available"
                 )
             
+            # Unbox the daily costs once for every statistic below
+            daily = _daily_cost_array(cost_data.get("daily_costs", []))
+            
             # Analyze cost patterns
-            cost_analysis = self._analyze_cost_patterns(cost_data)
+            cost_analysis = self._analyze_cost_patterns(cost_data, daily)
             
             # Identify optimization opportunities
             optimization_opportunities = self._identify_optimization_opportunities(cost_data)
@@ -71,7 +196,7 @@ class CostWatcherAgent(BaseAgent):
                 data={
                     "cost_analysis": cost_analysis,
                     "optimization_opportunities": optimization_opportunities,
-                    "current_spending": self._get_current_spending(cost_data)
+                    "current_spending": self._get_current_spending(cost_data, daily)
                 },
                 recommendations=recommendations,
                 actions=[]
@@ -128,109 +253,282 @@ class CostWatcherAgent(BaseAgent):
                 error_message=f"Cost optimization failed: {str(e)}"
             )
     
-    async def _fetch_aws_cost_data(self) -> Dict[str, Any]:
-        """Fetch cost data from AWS Cost Explorer."""
+    def clear_cache(self) -> None:
+        """Drop all cached Cost Explorer data."""
+        self._cost_cache.clear()
+        self._cost_window_entry = None
+    
+    async def _fetch_aws_cost_data(self, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Fetch cost data from AWS Cost Explorer.
+        
+        Daily spend is fetched grouped by service only. The usage-type
+        breakdown is then drilled into only for services that are a
+        meaningful share of the alert threshold, with a filtered query per
+        service, since extra GroupBy dimensions multiply the result size.
+        
+        Args:
+            use_cache: Whether a processed response younger than
+                ``cost_cache_ttl`` may be returned instead of querying AWS
+            
+        Returns:
+            Processed cost data, or an empty dict if unavailable
+        """
         try:
             if not self.settings.aws_access_key_id:
                 return {}
             
-            # Initialize AWS Cost Explorer client
-            ce_client = boto3.client(
+            # Get cost data for the last 30 days
+            start_date, end_date = self._cost_window()
+            
+            cache_key = (start_date, end_date, "DAILY", "SERVICE")
+            if use_cache:
+                cached = self._cost_cache.get(cache_key)
+                if cached is not None and time.monotonic() - cached[0] < self.cost_cache_ttl:
+                    return cached[1]
+            
+            # Concurrent analyses of the same window share one in-flight query
+            inflight = self._inflight_fetches.get(cache_key)
+            if inflight is None:
+                inflight = asyncio.ensure_future(self._load_cost_data(cache_key, start_date, end_date))
+                self._inflight_fetches[cache_key] = inflight
+                inflight.add_done_callback(lambda _: self._inflight_fetches.pop(cache_key, None))
+            
+            # Shielded so one cancelled caller does not cancel the shared query
+            return await asyncio.shield(inflight)
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching AWS cost data: {e}")
+            return {}
+    
+    def _cost_window(self) -> Tuple[date, date]:
+        """Return the start and end dates of the 30-day cost window."""
+        now = time.monotonic()
+        entry = self._cost_window_entry
+        if entry is None or now - entry[0] >= self._cost_window_ttl:
+            end_date = date.today()
+            entry = (now, end_date - timedelta(days=30), end_date)
+            self._cost_window_entry = entry
+        return entry[1], entry[2]
+    
+    async def _load_cost_data(self, cache_key: Tuple[Any, ...], start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        Query Cost Explorer for a date window and cache the processed result.
+        
+        Args:
+            cache_key: Cache key for the window
+            start_date: First day of the window
+            end_date: Day after the last day of the window
+            
+        Returns:
+            Processed cost data
+        """
+        # The first client build loads botocore models from disk
+        ce_client = await asyncio.to_thread(self._get_ce_client)
+        
+        time_period = {
+            'Start': start_date.isoformat(),
+            'End': end_date.isoformat()
+        }
+        
+        # boto3 is synchronous, so the query runs in a worker thread and
+        # each page is folded into the totals as it arrives
+        processed = await self._query_with_backoff(
+            ce_client,
+            self._process_cost_data,
+            TimePeriod=time_period,
+            Granularity='DAILY',
+            Metrics=[_COST_METRIC],
+            GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+        )
+        
+        # Drill into usage types only where the spend is worth explaining
+        drill_down_threshold = self.cost_threshold * 0.1
+        processed["usage_costs"] = await self._fetch_usage_costs(
+            ce_client,
+            time_period,
+            [service for service, cost in processed["service_costs"].items() if cost > drill_down_threshold]
+        )
+        
+        # Evict expired entries so stale date windows do not pile up
+        now = time.monotonic()
+        self._cost_cache = {
+            key: entry for key, entry in self._cost_cache.items()
+            if now - entry[0] < self.cost_cache_ttl
+        }
+        self._cost_cache[cache_key] = (now, processed)
+        
+        return processed
+    
+    def _get_ce_client(self) -> Any:
+        """Get the AWS Cost Explorer client, creating it on first use."""
+        if self._ce_client is None:
+            self._ce_client = boto3.client(
                 'ce',
                 aws_access_key_id=self.settings.aws_access_key_id,
                 aws_secret_access_key=self.settings.aws_secret_access_key,
                 region_name=self.settings.aws_region
             )
+        return self._ce_client
+    
+    async def _fetch_usage_costs(
+        self,
+        ce_client: Any,
+        time_period: Dict[str, str],
+        services: List[str]
+    ) -> Dict[str, float]:
+        """
+        Fetch the usage-type breakdown for each service concurrently.
+        
+        A service whose query still fails after retries is logged and left
+        out of the breakdown rather than failing the whole fetch.
+        
+        Args:
+            ce_client: Cost Explorer client
+            time_period: Cost Explorer ``TimePeriod`` to query
+            services: Services to break down
             
-            # Get cost data for the last 30 days
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            
-            response = ce_client.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date.strftime('%Y-%m-%d'),
-                    'End': end_date.strftime('%Y-%m-%d')
-                },
-                Granularity='DAILY',
-                Metrics=['UnblendedCost'],
-                GroupBy=[
-                    {'Type': 'DIMENSION', 'Key': 'SERVICE'},
-                    {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
-                ]
-            )
+        Returns:
+            Cost per usage type across the given services
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+        
+        async def fetch(service: str) -> Dict[str, float]:
+            async with semaphore:
+                return await self._query_with_backoff(
+                    ce_client,
+                    self._sum_group_costs,
+                    TimePeriod=time_period,
+                    Granularity='MONTHLY',
+                    Metrics=[_COST_METRIC],
+                    Filter={'Dimensions': {'Key': 'SERVICE', 'Values': [service]}},
+                    GroupBy=[{'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}]
+                )
+        
+        results = await asyncio.gather(*(fetch(service) for service in services), return_exceptions=True)
+        
+        usage_costs: DefaultDict[str, float] = defaultdict(float)
+        for service, result in zip(services, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Skipping usage breakdown for {service}: {result}")
+                continue
+            for usage_type, cost in result.items():
+                usage_costs[usage_type] += cost
+        
+        return dict(usage_costs)
+    
+    async def _query_with_backoff(
+        self,
+        ce_client: Any,
+        consume: Callable[[Iterator[Dict[str, Any]]], _T],
+        **params: Any
+    ) -> _T:
+        """
+        Run a paginated Cost Explorer query off the event loop, retrying throttling.
+        
+        Pages are fetched and consumed in the same worker thread, so only
+        the consumer's running totals are held rather than every page.
+        
+        Args:
+            ce_client: Cost Explorer client
+            consume: Folds the streamed ``ResultsByTime`` entries into a result
+            **params: Arguments for ``get_cost_and_usage``
             
-            return self._process_cost_data(response)
+        Returns:
+            Whatever ``consume`` returns
+        """
+        for attempt in range(self.max_query_attempts):
+            try:
+                return await asyncio.to_thread(consume, self._iter_cost_results(ce_client, **params))
+            except ClientError as e:
+                throttled = e.response.get('Error', {}).get('Code') == 'ThrottlingException'
+                if not throttled or attempt == self.max_query_attempts - 1:
+                    raise
+                await asyncio.sleep(0.5 * 2 ** attempt)
+    
+    def _iter_cost_results(self, ce_client: Any, **params: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream ``ResultsByTime`` entries from a Cost Explorer query across all pages.
+        
+        botocore has no paginator for ``get_cost_and_usage``, so this follows
+        ``NextPageToken`` itself and only requests a page once the previous
+        one has been consumed.
+        
+        Args:
+            ce_client: Cost Explorer client
+            **params: Arguments for ``get_cost_and_usage``
             
-        except Exception as e:
-            self.logger.error(f"Error fetching AWS cost data: {e}")
-            return {}
+        Yields:
+            Results from every page, in order
+        """
+        while True:
+            response = ce_client.get_cost_and_usage(**params)
+            yield from response.get('ResultsByTime', [])
+            
+            token = response.get('NextPageToken')
+            if not token:
+                return
+            params['NextPageToken'] = token
     
-    def _process_cost_data(self, cost_response: Dict[str, Any]) -> Dict[str, Any]:
-        """Process AWS Cost Explorer response."""
-        processed_data = {
-            "total_cost": 0.0,
-            "daily_costs": [],
-            "service_costs": {},
+    def _process_cost_data(self, results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Process service-grouped AWS Cost Explorer results in a single pass.
+        
+        Errors are left to the caller, so a throttled page is retried rather
+        than reported as partial data.
+        """
+        # Later pages repeat a day's time period with the rest of its groups
+        daily_totals: DefaultDict[str, float] = defaultdict(float)
+        service_costs: DefaultDict[str, float] = defaultdict(float)
+        for result in results:
+            group_total = 0.0
+            for group in result.get('Groups', []):
+                cost = float(group['Metrics'][_COST_METRIC]['Amount'])
+                service_costs[group['Keys'][0]] += cost
+                group_total += cost
+            
+            # Grouped queries usually leave Total empty; fall back to the groups
+            total = result.get('Total', {}).get(_COST_METRIC)
+            day_cost = float(total['Amount']) if total is not None else group_total
+            daily_totals[result['TimePeriod']['Start']] += day_cost
+        
+        return {
+            "total_cost": sum(daily_totals.values()),
+            "daily_costs": [{"date": day, "cost": cost} for day, cost in daily_totals.items()],
+            "service_costs": dict(service_costs),
             "usage_costs": {}
         }
+    
+    def _sum_group_costs(self, results: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+        """Sum grouped Cost Explorer amounts by group key."""
+        costs: DefaultDict[str, float] = defaultdict(float)
+        for result in results:
+            for group in result.get('Groups', []):
+                costs[group['Keys'][0]] += float(group['Metrics'][_COST_METRIC]['Amount'])
         
-        try:
-            for result in cost_response.get('ResultsByTime', []):
-                day_cost = float(result['Total']['UnblendedCost']['Amount'])
-                processed_data["total_cost"] += day_cost
-                processed_data["daily_costs"].append({
-                    "date": result['TimePeriod']['Start'],
-                    "cost": day_cost
-                })
-                
-                # Process service costs
-                for group in result.get('Groups', []):
-                    keys = group['Keys']
-                    cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                    
-                    if len(keys) >= 2:
-                        service = keys[0]
-                        usage_type = keys[1]
-                        
-                        if service not in processed_data["service_costs"]:
-                            processed_data["service_costs"][service] = 0.0
-                        processed_data["service_costs"][service] += cost
-                        
-                        if usage_type not in processed_data["usage_costs"]:
-                            processed_data["usage_costs"][usage_type] = 0.0
-                        processed_data["usage_costs"][usage_type] += cost
-            
-            return processed_data
-            
-        except Exception as e:
-            self.logger.error(f"Error processing cost data: {e}")
-            return processed_data
+        return dict(costs)
     
-    def _analyze_cost_patterns(self, cost_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_cost_patterns(self, cost_data: Dict[str, Any], daily: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Analyze cost patterns and trends."""
         try:
             total_cost = cost_data.get("total_cost", 0.0)
-            daily_costs = cost_data.get("daily_costs", [])
             service_costs = cost_data.get("service_costs", {})
+            if daily is None:
+                daily = _daily_cost_array(cost_data.get("daily_costs", []))
             
             # Calculate basic statistics
-            if daily_costs:
-                costs = [day["cost"] for day in daily_costs]
-                avg_daily_cost = sum(costs) / len(costs)
-                max_daily_cost = max(costs)
-                min_daily_cost = min(costs)
+            if daily.size:
+                avg_daily_cost = float(daily.mean())
+                max_daily_cost = float(daily.max())
+                min_daily_cost = float(daily.min())
             else:
                 avg_daily_cost = max_daily_cost = min_daily_cost = 0.0
             
             # Identify top spending services
-            top_services = sorted(
-                service_costs.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]
+            top_services = heapq.nlargest(5, service_costs.items(), key=itemgetter(1))
             
             # Calculate cost trends
-            trend = self._calculate_cost_trend(daily_costs)
+            trend = self._calculate_cost_trend(daily)
             
             return {
                 "total_cost": total_cost,
@@ -252,59 +550,31 @@ class CostWatcherAgent(BaseAgent):
         
         try:
             service_costs = cost_data.get("service_costs", {})
-            usage_costs = cost_data.get("usage_costs", {})
-            
-            # Check for idle resources
-            if "AmazonEC2" in service_costs:
-                ec2_cost = service_costs["AmazonEC2"]
-                if ec2_cost > self.cost_threshold * 0.3:  # 30% of threshold
-                    opportunities.append({
-                        "type": "idle_resources",
-                        "service": "EC2",
-                        "current_cost": ec2_cost,
-                        "potential_savings": ec2_cost * 0.2,  # 20% potential savings
-                        "description": "Consider stopping idle EC2 instances",
-                        "priority": "medium"
-                    })
-            
-            # Check for storage optimization
-            if "AmazonS3" in service_costs:
-                s3_cost = service_costs["AmazonS3"]
-                if s3_cost > self.cost_threshold * 0.2:  # 20% of threshold
-                    opportunities.append({
-                        "type": "storage_optimization",
-                        "service": "S3",
-                        "current_cost": s3_cost,
-                        "potential_savings": s3_cost * 0.15,  # 15% potential savings
-                        "description": "Consider S3 lifecycle policies and storage class optimization",
-                        "priority": "low"
-                    })
-            
-            # Check for database optimization
-            if "AmazonRDS" in service_costs:
-                rds_cost = service_costs["AmazonRDS"]
-                if rds_cost > self.cost_threshold * 0.25:  # 25% of threshold
-                    opportunities.append({
-                        "type": "database_optimization",
-                        "service": "RDS",
-                        "current_cost": rds_cost,
-                        "potential_savings": rds_cost * 0.25,  # 25% potential savings
-                        "description": "Consider RDS instance optimization and reserved instances",
-                        "priority": "medium"
-                    })
-            
-            # Check for data transfer costs
-            if "AWS Data Transfer" in service_costs:
-                transfer_cost = service_costs["AWS Data Transfer"]
-                if transfer_cost > self.cost_threshold * 0.1:  # 10% of threshold
-                    opportunities.append({
-                        "type": "data_transfer_optimization",
-                        "service": "Data Transfer",
-                        "current_cost": transfer_cost,
-                        "potential_savings": transfer_cost * 0.3,  # 30% potential savings
-                        "description": "Optimize data transfer patterns and use CloudFront",
-                        "priority": "high"
-                    })
+            
+            # No per-service spending, so no rule can match
+            if not service_costs:
+                return opportunities
+            
+            # Evaluate every rule in one comparison; missing services are NaN
+            # and never pass the threshold
+            costs = np.fromiter(
+                (service_costs.get(key, np.nan) for key in _RULE_SERVICE_KEYS),
+                dtype=np.float64,
+                count=len(_RULE_SERVICE_KEYS)
+            )
+            matched = np.flatnonzero(costs > self.cost_threshold * _RULE_THRESHOLD_FRACTIONS)
+            savings = costs * _RULE_SAVINGS_FRACTIONS
+            
+            for index in matched.tolist():
+                rule = _OPTIMIZATION_RULES[index]
+                opportunities.append({
+                    "type": rule.opportunity_type,
+                    "service": rule.service_name,
+                    "current_cost": service_costs[rule.service_key],
+                    "potential_savings": float(savings[index]),
+                    "description": rule.description,
+                    "priority": rule.priority
+                })
             
             return opportunities
             
@@ -316,34 +586,22 @@ class CostWatcherAgent(BaseAgent):
         """Generate cost optimization recommendations."""
         recommendations = []
         
+        total_cost = cost_analysis.get("total_cost", 0.0)
+        spending = format(total_cost, ".2f")
+        
         # Budget alert recommendations
         budget_status = cost_analysis.get("budget_status", {})
         if budget_status.get("exceeded", False):
             recommendations.append({
-                "title": "Budget Exceeded",
-                "description": f"Current spending (${cost_analysis.get('total_cost', 0):.2f}) exceeds budget threshold",
-                "priority": "high",
-                "impact": "cost_reduction",
-                "actions": [
-                    "Review and stop unnecessary resources",
-                    "Implement cost alerts",
-                    "Consider reserved instances"
-                ]
+                **_BUDGET_EXCEEDED_RECOMMENDATION,
+                "description": f"Current spending (${spending}) exceeds budget threshold"
             })
         
         # High spending recommendations
-        total_cost = cost_analysis.get("total_cost", 0.0)
         if total_cost > self.cost_threshold:
             recommendations.append({
-                "title": "High Spending Alert",
-                "description": f"Current spending (${total_cost:.2f}) is above threshold (${self.cost_threshold})",
-                "priority": "medium",
-                "impact": "cost_reduction",
-                "actions": [
-                    "Analyze spending patterns",
-                    "Identify optimization opportunities",
-                    "Implement cost controls"
-                ]
+                **_HIGH_SPENDING_RECOMMENDATION,
+                "description": f"Current spending (${spending}) is above threshold (${self.cost_threshold})"
             })
         
         # Optimization opportunities
@@ -354,31 +612,20 @@ class CostWatcherAgent(BaseAgent):
         
         for opportunity in significant_opportunities:
             recommendations.append({
-                "title": f"{opportunity['type'].title()} Opportunity",
+                "title": _OPPORTUNITY_TITLES.get(opportunity["type"], f"{opportunity['type']} Opportunity"),
                 "description": opportunity["description"],
                 "priority": opportunity["priority"],
                 "impact": "cost_reduction",
-                "actions": [
+                "actions": (
                     f"Review {opportunity['service']} usage",
                     "Implement optimization strategies",
                     f"Potential savings: ${opportunity['potential_savings']:.2f}"
-                ]
+                )
             })
         
         # Trend-based recommendations
-        trend = cost_analysis.get("trend", "stable")
-        if trend == "increasing":
-            recommendations.append({
-                "title": "Increasing Cost Trend",
-                "description": "Costs are trending upward, consider proactive optimization",
-                "priority": "medium",
-                "impact": "cost_control",
-                "actions": [
-                    "Monitor cost trends",
-                    "Implement cost controls",
-                    "Review resource usage"
-                ]
-            })
+        if cost_analysis.get("trend", "stable") == "increasing":
+            recommendations.append({**_INCREASING_TREND_RECOMMENDATION})
         
         return recommendations
     
@@ -392,11 +639,17 @@ class CostWatcherAgent(BaseAgent):
         }
         
         try:
+            # Running sum for the overall average, kept while building each entry
+            total_util = 0.0
+            util_count = 0
+            
             # Analyze EC2 instances
             ec2_instances = resources.get("ec2", [])
             for instance in ec2_instances:
                 cpu_util = instance.get("cpu_utilization", 0.0)
                 memory_util = instance.get("memory_utilization", 0.0)
+                total_util += cpu_util + memory_util
+                util_count += 2
                 
                 utilization["ec2_instances"].append({
                     "instance_id": instance.get("id", "unknown"),
@@ -412,6 +665,8 @@ class CostWatcherAgent(BaseAgent):
             for instance in rds_instances:
                 cpu_util = instance.get("cpu_utilization", 0.0)
                 storage_util = instance.get("storage_utilization", 0.0)
+                total_util += cpu_util + storage_util
+                util_count += 2
                 
                 utilization["rds_instances"].append({
                     "instance_id": instance.get("id", "unknown"),
@@ -422,15 +677,8 @@ class CostWatcherAgent(BaseAgent):
                     "optimization_potential": self._calculate_optimization_potential(cpu_util, storage_util)
                 })
             
-            # Calculate overall utilization
-            all_utils = []
-            for ec2 in utilization["ec2_instances"]:
-                all_utils.extend([ec2["cpu_utilization"], ec2["memory_utilization"]])
-            for rds in utilization["rds_instances"]:
-                all_utils.extend([rds["cpu_utilization"], rds["storage_utilization"]])
-            
-            if all_utils:
-                utilization["overall_utilization"] = sum(all_utils) / len(all_utils)
+            if util_count:
+                utilization["overall_utilization"] = total_util / util_count
             
             return utilization
             
@@ -478,27 +726,28 @@ class CostWatcherAgent(BaseAgent):
         
         return actions
     
-    def _get_current_spending(self, cost_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_current_spending(self, cost_data: Dict[str, Any], daily: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Get current spending summary."""
+        if daily is None:
+            daily = _daily_cost_array(cost_data.get("daily_costs", []))
+        
         return {
             "total_cost": cost_data.get("total_cost", 0.0),
             "top_services": cost_data.get("service_costs", {}),
-            "daily_average": sum(day["cost"] for day in cost_data.get("daily_costs", [])) / max(len(cost_data.get("daily_costs", [])), 1)
+            "daily_average": float(daily.mean()) if daily.size else 0.0
         }
     
-    def _calculate_cost_trend(self, daily_costs: List[Dict[str, Any]]) -> str:
-        """Calculate cost trend from daily costs."""
-        if len(daily_costs) < 7:
+    def _calculate_cost_trend(self, daily: np.ndarray) -> str:
+        """Calculate cost trend from an array of daily costs."""
+        if daily.size < 7:
             return "insufficient_data"
         
-        recent_costs = [day["cost"] for day in daily_costs[-7:]]
-        earlier_costs = [day["cost"] for day in daily_costs[-14:-7]]
-        
-        if not earlier_costs:
+        earlier_costs = daily[-14:-7]
+        if not earlier_costs.size:
             return "stable"
         
-        recent_avg = sum(recent_costs) / len(recent_costs)
-        earlier_avg = sum(earlier_costs) / len(earlier_costs)
+        recent_avg = daily[-7:].mean()
+        earlier_avg = earlier_costs.mean()
         
         if recent_avg > earlier_avg * 1.1:
             return "increasing"
@@ -528,20 +777,8 @@ class CostWatcherAgent(BaseAgent):
     
     def _suggest_instance_type(self, current_type: str, cpu_util: float) -> str:
         """Suggest a smaller instance type based on utilization."""
-        # Simplified instance type suggestions
-        if cpu_util < 0.2:
-            return "t3.micro" if "t3" not in current_type else current_type
-        elif cpu_util < 0.4:
-            return "t3.small" if "t3" not in current_type else current_type
-        else:
-            return current_type
+        return _suggest_size(_EC2_SIZE_SUGGESTIONS, current_type, cpu_util)
     
     def _suggest_rds_instance_type(self, current_type: str, cpu_util: float) -> str:
         """Suggest a smaller RDS instance type based on utilization."""
-        # Simplified RDS instance type suggestions
-        if cpu_util < 0.2:
-            return "db.t3.micro" if "t3" not in current_type else current_type
-        elif cpu_util < 0.4:
-            return "db.t3.small" if "t3" not in current_type else current_type
-        else:
-            return current_type
+        return _suggest_size(_RDS_SIZE_SUGGESTIONS, current_type, cpu_util)
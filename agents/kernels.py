@@ -0,0 +1,610 @@
+"""
+Numeric kernels for DevOps AI Platform agents.
+
+This module holds the tight numeric loops used by the analytics agents.
+When Numba is installed the kernels are JIT-compiled to native code on
+first use; otherwise equivalent vectorized NumPy implementations are used.
+"""
+
+import math
+import threading
+import numpy as np
+from typing import Any, Callable, Optional, Tuple
+
+
+# Numba is imported when the first kernel is resolved, not with this module;
+# it costs far more to import than the agents that use it
+_UNRESOLVED = object()
+_njit: Any = _UNRESOLVED
+_resolve_lock = threading.Lock()
+
+
+def _load_njit() -> Optional[Callable[..., Any]]:
+    """Get Numba's ``njit`` decorator, or None when Numba is not installed."""
+    global _njit
+    if _njit is _UNRESOLVED:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover - depends on the environment
+            njit = None
+        _njit = njit
+    return _njit
+
+
+def numba_available() -> bool:
+    """Check whether the kernels are JIT-compiled with Numba."""
+    with _resolve_lock:
+        return _load_njit() is not None
+
+
+class _Kernel:
+    """
+    A numeric kernel that picks its implementation on first use.
+
+    The loop implementation is JIT-compiled when Numba is installed;
+    otherwise the vectorized NumPy implementation is used. Both take the
+    same arguments and return the same results.
+    """
+
+    def __init__(
+        self,
+        loop_impl: Callable[..., Any],
+        numpy_impl: Callable[..., Any],
+        warm_args: Tuple[Any, ...],
+        **jit_options: Any
+    ):
+        self._loop_impl = loop_impl
+        self._numpy_impl = numpy_impl
+        self._warm_args = warm_args
+        self._jit_options = jit_options
+        self._impl: Optional[Callable[..., Any]] = None
+        self.__doc__ = loop_impl.__doc__
+
+    def __call__(self, *args: Any) -> Any:
+        impl = self._impl
+        if impl is None:
+            impl = self._resolve()
+        return impl(*args)
+
+    def _resolve(self) -> Callable[..., Any]:
+        """Pick, and compile if needed, the implementation to call."""
+        with _resolve_lock:
+            if self._impl is None:
+                njit = _load_njit()
+                if njit is None:
+                    self._impl = self._numpy_impl
+                else:
+                    self._impl = njit(**self._jit_options)(self._loop_impl)
+            return self._impl
+
+    def warm_up(self) -> None:
+        """Compile the kernel now rather than on its first real call."""
+        impl = self._resolve()
+        if impl is not self._numpy_impl:
+            impl(*self._warm_args)
+
+
+def warm_up(*kernels: _Kernel) -> None:
+    """
+    Compile the given kernels ahead of their first real call.
+
+    Args:
+        kernels: Kernels the caller is about to use
+    """
+    for kernel in kernels:
+        kernel.warm_up()
+
+
+# Smallest inputs of the types the agents pass; metric samples are stored
+# as float32, baselines as float64
+_WARM_SAMPLES = np.zeros((1, 2), dtype=np.float32)
+_WARM_BASELINE = np.zeros((1, 2), dtype=np.float64)
+_WARM_TRAFFIC = np.arange(3, dtype=np.float32)
+
+
+def _zscore_outliers_loop(
+    values: np.ndarray,
+    center: np.ndarray,
+    scale: np.ndarray,
+    threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find samples whose absolute z-score exceeds a threshold.
+
+    Args:
+        values: 2-D array with one series per row
+        center: Per-sample baseline mean
+        scale: Per-sample baseline standard deviation
+        threshold: Z-score threshold
+
+    Returns:
+        Tuple of outlier row indices, column indices and absolute z-scores
+    """
+    rows, cols = values.shape
+    out_row = np.empty(rows * cols, dtype=np.int64)
+    out_col = np.empty(rows * cols, dtype=np.int64)
+    out_z = np.empty(rows * cols, dtype=np.float64)
+    k = 0
+    for r in range(rows):
+        for c in range(cols):
+            deviation = abs(values[r, c] - center[r, c])
+            if deviation > threshold * scale[r, c]:
+                out_row[k] = r
+                out_col[k] = c
+                out_z[k] = deviation / scale[r, c]
+                k += 1
+    return out_row[:k], out_col[:k], out_z[:k]
+
+
+def _zscore_outliers_numpy(
+    values: np.ndarray,
+    center: np.ndarray,
+    scale: np.ndarray,
+    threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find samples whose absolute z-score exceeds a threshold.
+
+    Args:
+        values: 2-D array with one series per row
+        center: Per-sample baseline mean
+        scale: Per-sample baseline standard deviation
+        threshold: Z-score threshold
+
+    Returns:
+        Tuple of outlier row indices, column indices and absolute z-scores
+    """
+    deviation = np.abs(values - center)
+    out_row, out_col = np.nonzero(deviation > threshold * scale)
+    return out_row, out_col, deviation[out_row, out_col] / scale[out_row, out_col]
+
+
+zscore_outliers = _Kernel(
+    _zscore_outliers_loop, _zscore_outliers_numpy,
+    (_WARM_SAMPLES, _WARM_BASELINE, _WARM_BASELINE, 1.0),
+    cache=True, fastmath=True
+)
+
+
+def _bocpd_baseline_loop(
+    values: np.ndarray,
+    mu0: float,
+    kappa0: float,
+    alpha0: float,
+    beta0: float,
+    hazard: float,
+    prune_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run pruned Bayesian online change point detection over a series.
+
+    Each sample gets the mean and spread of the run-length posterior's
+    Student-t predictive distribution, computed before the sample is
+    observed. Run lengths whose posterior mass drops below
+    ``prune_threshold`` are discarded, keeping the per-step cost bounded.
+
+    Args:
+        values: 1-D array of samples
+        mu0: Prior mean
+        kappa0: Prior pseudo-count for the mean
+        alpha0: Prior shape of the precision
+        beta0: Prior rate of the precision
+        hazard: Constant change point probability per step
+        prune_threshold: Minimum posterior mass for a run length to be kept
+
+    Returns:
+        Tuple of per-sample predictive center and scale
+    """
+    n = values.shape[0]
+    center = np.empty(n, dtype=np.float64)
+    scale = np.empty(n, dtype=np.float64)
+
+    cap = n + 1
+    weight = np.empty(cap, dtype=np.float64)
+    mu = np.empty(cap, dtype=np.float64)
+    kappa = np.empty(cap, dtype=np.float64)
+    alpha = np.empty(cap, dtype=np.float64)
+    beta = np.empty(cap, dtype=np.float64)
+    lg = np.empty(cap, dtype=np.float64)
+    next_weight = np.empty(cap, dtype=np.float64)
+    next_mu = np.empty(cap, dtype=np.float64)
+    next_kappa = np.empty(cap, dtype=np.float64)
+    next_alpha = np.empty(cap, dtype=np.float64)
+    next_beta = np.empty(cap, dtype=np.float64)
+    next_lg = np.empty(cap, dtype=np.float64)
+
+    # lg holds lgamma(alpha + 0.5) - lgamma(alpha) for each run, which
+    # follows the recurrence g(a + 0.5) = log(a) - g(a)
+    lg0 = math.lgamma(alpha0 + 0.5) - math.lgamma(alpha0)
+    size = 1
+    weight[0] = 1.0
+    mu[0] = mu0
+    kappa[0] = kappa0
+    alpha[0] = alpha0
+    beta[0] = beta0
+    lg[0] = lg0
+
+    for t in range(n):
+        x = values[t]
+
+        # Predictive baseline before observing x
+        c = 0.0
+        m2 = 0.0
+        for r in range(size):
+            s2 = beta[r] * (kappa[r] + 1.0) / (alpha[r] * kappa[r])
+            c += weight[r] * mu[r]
+            m2 += weight[r] * (s2 + mu[r] * mu[r])
+        center[t] = c
+        scale[t] = math.sqrt(max(m2 - c * c, 0.0))
+
+        # Grow every run by one step and collect change point mass
+        cp_mass = 0.0
+        total = 0.0
+        for r in range(size):
+            s2 = beta[r] * (kappa[r] + 1.0) / (alpha[r] * kappa[r])
+            df = 2.0 * alpha[r]
+            d = x - mu[r]
+            log_pred = (
+                lg[r]
+                - 0.5 * math.log(df * math.pi * s2)
+                - (alpha[r] + 0.5) * math.log1p(d * d / (df * s2))
+            )
+            joint = weight[r] * math.exp(log_pred)
+            cp_mass += joint * hazard
+            grown = joint * (1.0 - hazard)
+            next_weight[r + 1] = grown
+            total += grown
+            next_mu[r + 1] = (kappa[r] * mu[r] + x) / (kappa[r] + 1.0)
+            next_kappa[r + 1] = kappa[r] + 1.0
+            next_alpha[r + 1] = alpha[r] + 0.5
+            next_beta[r + 1] = beta[r] + kappa[r] * d * d / (2.0 * (kappa[r] + 1.0))
+            next_lg[r + 1] = math.log(alpha[r]) - lg[r]
+        next_weight[0] = cp_mass
+        total += cp_mass
+        next_mu[0] = mu0
+        next_kappa[0] = kappa0
+        next_alpha[0] = alpha0
+        next_beta[0] = beta0
+        next_lg[0] = lg0
+
+        # Normalize, prune negligible run lengths and renormalize
+        if total <= 0.0:
+            size = 1
+            weight[0] = 1.0
+            mu[0] = mu0
+            kappa[0] = kappa0
+            alpha[0] = alpha0
+            beta[0] = beta0
+            lg[0] = lg0
+            continue
+        max_weight = 0.0
+        for r in range(size + 1):
+            next_weight[r] /= total
+            max_weight = max(max_weight, next_weight[r])
+        cutoff = min(prune_threshold, max_weight)
+        kept = 0
+        kept_total = 0.0
+        for r in range(size + 1):
+            w = next_weight[r]
+            if w >= cutoff:
+                weight[kept] = w
+                mu[kept] = next_mu[r]
+                kappa[kept] = next_kappa[r]
+                alpha[kept] = next_alpha[r]
+                beta[kept] = next_beta[r]
+                lg[kept] = next_lg[r]
+                kept_total += w
+                kept += 1
+        for r in range(kept):
+            weight[r] /= kept_total
+        size = kept
+
+    return center, scale
+
+
+def _bocpd_baseline_numpy(
+    values: np.ndarray,
+    mu0: float,
+    kappa0: float,
+    alpha0: float,
+    beta0: float,
+    hazard: float,
+    prune_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run pruned Bayesian online change point detection over a series.
+
+    Each sample gets the mean and spread of the run-length posterior's
+    Student-t predictive distribution, computed before the sample is
+    observed. Run lengths whose posterior mass drops below
+    ``prune_threshold`` are discarded, keeping the per-step cost bounded.
+
+    Args:
+        values: 1-D array of samples
+        mu0: Prior mean
+        kappa0: Prior pseudo-count for the mean
+        alpha0: Prior shape of the precision
+        beta0: Prior rate of the precision
+        hazard: Constant change point probability per step
+        prune_threshold: Minimum posterior mass for a run length to be kept
+
+    Returns:
+        Tuple of per-sample predictive center and scale
+    """
+    n = values.shape[0]
+    center = np.empty(n, dtype=np.float64)
+    scale = np.empty(n, dtype=np.float64)
+
+    # lg holds lgamma(alpha + 0.5) - lgamma(alpha) for each run, which
+    # follows the recurrence g(a + 0.5) = log(a) - g(a)
+    lg0 = math.lgamma(alpha0 + 0.5) - math.lgamma(alpha0)
+    prior = np.array([mu0, kappa0, alpha0, beta0, lg0])
+    weight = np.ones(1)
+    mu = np.array([mu0])
+    kappa = np.array([kappa0])
+    alpha = np.array([alpha0])
+    beta = np.array([beta0])
+    lg = np.array([lg0])
+
+    for t in range(n):
+        x = values[t]
+        s2 = beta * (kappa + 1.0) / (alpha * kappa)
+
+        # Predictive baseline before observing x
+        c = float(weight.dot(mu))
+        m2 = float(weight.dot(s2 + mu * mu))
+        center[t] = c
+        scale[t] = math.sqrt(max(m2 - c * c, 0.0))
+
+        # Grow every run by one step and collect change point mass
+        df = 2.0 * alpha
+        d = x - mu
+        log_pred = lg - 0.5 * np.log(df * math.pi * s2) - (alpha + 0.5) * np.log1p(d * d / (df * s2))
+        joint = weight * np.exp(log_pred)
+        new_weight = np.concatenate(([joint.sum() * hazard], joint * (1.0 - hazard)))
+        total = new_weight.sum()
+        if total <= 0.0:
+            weight = np.ones(1)
+            mu, kappa, alpha, beta, lg = (prior[i:i + 1].copy() for i in range(5))
+            continue
+
+        new_mu = np.concatenate(([mu0], (kappa * mu + x) / (kappa + 1.0)))
+        new_beta = np.concatenate(([beta0], beta + kappa * d * d / (2.0 * (kappa + 1.0))))
+        new_lg = np.concatenate(([lg0], np.log(alpha) - lg))
+        new_kappa = np.concatenate(([kappa0], kappa + 1.0))
+        new_alpha = np.concatenate(([alpha0], alpha + 0.5))
+
+        # Normalize, prune negligible run lengths and renormalize
+        new_weight /= total
+        keep = new_weight >= min(prune_threshold, new_weight.max())
+        weight = new_weight[keep]
+        weight /= weight.sum()
+        mu = new_mu[keep]
+        kappa = new_kappa[keep]
+        alpha = new_alpha[keep]
+        beta = new_beta[keep]
+        lg = new_lg[keep]
+
+    return center, scale
+
+
+bocpd_baseline = _Kernel(
+    _bocpd_baseline_loop, _bocpd_baseline_numpy,
+    (_WARM_SAMPLES[0], 0.0, 1.0, 1.0, 1.0, 0.01, 1e-4),
+    cache=True
+)
+
+
+# Z-score cut points for burst probability; a z-score above the i-th bin
+# (and at most the next) maps to _BURST_PROBABILITIES[i + 1]
+_BURST_Z_BINS = np.array([1.0, 1.5, 2.0])
+_BURST_PROBABILITIES = np.array([0.2, 0.5, 0.7, 0.9])
+
+
+def _summary_stats_loop(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Get the mean, sample standard deviation, min and max in one pass.
+
+    The deviation uses Welford's update, so it stays accurate for
+    large, slowly varying values where the sum of squares would cancel.
+
+    Args:
+        values: Non-empty 1-D array of samples
+
+    Returns:
+        Tuple of mean, standard deviation (ddof=1, NaN for one sample),
+        min and max
+    """
+    mean = 0.0
+    m2 = 0.0
+    lo = values[0]
+    hi = values[0]
+    for i in range(values.shape[0]):
+        value = values[i]
+        delta = value - mean
+        mean += delta / (i + 1)
+        m2 += delta * (value - mean)
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    n = values.shape[0]
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else math.nan
+    return mean, std, float(lo), float(hi)
+
+
+def _mean_slope_loop(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Get the mean and least-squares slope of evenly spaced samples.
+
+    With x = 0..n-1 the sums of x and x^2 are closed-form, so the fit
+    needs one pass instead of a Vandermonde least-squares solve.
+
+    Args:
+        values: 1-D array of samples
+
+    Returns:
+        Tuple of mean and slope per sample
+    """
+    n = values.shape[0]
+    sum_x = n * (n - 1) / 2.0
+    sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    for i in range(n):
+        sum_y += values[i]
+        sum_xy += i * values[i]
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
+    return sum_y / n, slope
+
+
+def _burst_forecast_loop(
+    values: np.ndarray,
+    mean: float,
+    std: float,
+    window: int,
+    horizon: int
+) -> Tuple[np.ndarray, float, np.ndarray]:
+    """
+    Forecast traffic for the next ``horizon`` steps.
+
+    The forecast extends the trailing window's mean along its trend.
+    Confidence falls with the trailing window's volatility and burst
+    probability grows with each prediction's z-score against the full
+    history.
+
+    Args:
+        values: 1-D array of samples, oldest first, at least ``window`` long
+        mean: Mean of the full history
+        std: Sample standard deviation of the full history
+        window: Number of trailing samples the forecast is fitted on
+        horizon: Number of steps to forecast
+
+    Returns:
+        Tuple of predicted values, confidence and burst probabilities
+    """
+    # Fit the trailing window's mean, trend and spread in a single pass
+    offset = values.shape[0] - window
+    recent_mean = 0.0
+    recent_m2 = 0.0
+    sum_xy = 0.0
+    for i in range(window):
+        value = values[offset + i]
+        delta = value - recent_mean
+        recent_mean += delta / (i + 1)
+        recent_m2 += delta * (value - recent_mean)
+        sum_xy += i * value
+    sum_x = window * (window - 1) / 2.0
+    sum_xx = (window - 1) * window * (2 * window - 1) / 6.0
+    trend = (window * sum_xy - sum_x * window * recent_mean) / (window * sum_xx - sum_x * sum_x)
+    recent_std = (recent_m2 / (window - 1)) ** 0.5
+
+    if mean == 0.0:
+        confidence = 0.5
+    else:
+        confidence = min(1.0, max(0.1, 1.0 - recent_std / mean))
+
+    predicted = np.empty(horizon, dtype=np.float64)
+    probability = np.empty(horizon, dtype=np.float64)
+    for h in range(horizon):
+        value = recent_mean + trend * (h + 1)
+        predicted[h] = value
+        if std == 0.0:
+            probability[h] = 0.0
+            continue
+        probability[h] = _BURST_PROBABILITIES[np.searchsorted(_BURST_Z_BINS, (value - mean) / std)]
+    return predicted, confidence, probability
+
+
+def _summary_stats_numpy(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Get the mean, sample standard deviation, min and max.
+
+    Args:
+        values: Non-empty 1-D array of samples
+
+    Returns:
+        Tuple of mean, standard deviation (ddof=1, NaN for one sample),
+        min and max
+    """
+    mean = float(values.mean(dtype=np.float64))
+    std = float(values.std(ddof=1, dtype=np.float64)) if values.shape[0] > 1 else math.nan
+    return mean, std, float(values.min()), float(values.max())
+
+
+def _mean_slope_numpy(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Get the mean and least-squares slope of evenly spaced samples.
+
+    With x = 0..n-1 the sums of x and x^2 are closed-form, so the fit
+    needs one sum and one dot product instead of a Vandermonde
+    least-squares solve.
+
+    Args:
+        values: 1-D array of samples
+
+    Returns:
+        Tuple of mean and slope per sample
+    """
+    n = values.shape[0]
+    sum_x = n * (n - 1) / 2.0
+    sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+    sum_y = float(values.sum(dtype=np.float64))
+    sum_xy = float(np.dot(values, np.arange(n, dtype=np.float64)))
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
+    return sum_y / n, slope
+
+
+def _burst_forecast_numpy(
+    values: np.ndarray,
+    mean: float,
+    std: float,
+    window: int,
+    horizon: int
+) -> Tuple[np.ndarray, float, np.ndarray]:
+    """
+    Forecast traffic for the next ``horizon`` steps.
+
+    The forecast extends the trailing window's mean along its trend.
+    Confidence falls with the trailing window's volatility and burst
+    probability grows with each prediction's z-score against the full
+    history.
+
+    Args:
+        values: 1-D array of samples, oldest first, at least ``window`` long
+        mean: Mean of the full history
+        std: Sample standard deviation of the full history
+        window: Number of trailing samples the forecast is fitted on
+        horizon: Number of steps to forecast
+
+    Returns:
+        Tuple of predicted values, confidence and burst probabilities
+    """
+    recent = values[-window:]
+    recent_mean, trend = _mean_slope_numpy(recent)
+    recent_std = float(recent.std(ddof=1, dtype=np.float64))
+
+    if mean == 0.0:
+        confidence = 0.5
+    else:
+        confidence = min(1.0, max(0.1, 1.0 - recent_std / mean))
+
+    predicted = recent_mean + trend * np.arange(1, horizon + 1, dtype=np.float64)
+    if std == 0.0:
+        return predicted, confidence, np.zeros(horizon, dtype=np.float64)
+    probability = _BURST_PROBABILITIES[np.searchsorted(_BURST_Z_BINS, (predicted - mean) / std)]
+    return predicted, confidence, probability
+
+
+summary_stats = _Kernel(
+    _summary_stats_loop, _summary_stats_numpy, (_WARM_TRAFFIC,),
+    cache=True, nogil=True
+)
+mean_slope = _Kernel(
+    _mean_slope_loop, _mean_slope_numpy, (_WARM_TRAFFIC,),
+    cache=True, nogil=True, fastmath=True
+)
+burst_forecast = _Kernel(
+    _burst_forecast_loop, _burst_forecast_numpy, (_WARM_TRAFFIC, 1.0, 1.0, 2, 1),
+    cache=True, nogil=True, fastmath=True
+)
@@ -6,22 +6,85 @@ in the platform.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Type
-from datetime import datetime
+import atexit
+import dataclasses
+import importlib
+import itertools
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional, Tuple, Type
 
 from core.logging import LoggerMixin
 from core.config import Settings
-from agents.base import BaseAgent, AgentType, AgentContext, AgentResult
+from agents.base import BaseAgent, AgentContext, AgentResult, AgentStatus, AgentType
 
-# Import all agent implementations
-from agents.burst_predictor import BurstPredictorAgent
-from agents.cost_watcher import CostWatcherAgent
-from agents.anomaly_detector import AnomalyDetectorAgent
-from agents.auto_scaler_advisor import AutoScalerAdvisorAgent
-from agents.bottleneck_scanner import BottleneckScannerAgent
-from agents.security_responder import SecurityResponderAgent
-from agents.capacity_planner import CapacityPlannerAgent
-from agents.load_shifter import LoadShifterAgent
+
+# Built-in agents in initialization order as (type, module, class name).
+# Implementations are imported only when an agent is constructed, so code that
+# merely touches the registry does not pull in pandas, boto3 or Numba
+_BUILTIN_AGENTS: Tuple[Tuple[AgentType, str, str], ...] = (
+    (AgentType.BURST_PREDICTOR, "agents.burst_predictor", "BurstPredictorAgent"),
+    (AgentType.COST_WATCHER, "agents.cost_watcher", "CostWatcherAgent"),
+    (AgentType.ANOMALY_DETECTOR, "agents.anomaly_detector", "AnomalyDetectorAgent"),
+    (AgentType.AUTO_SCALER_ADVISOR, "agents.auto_scaler_advisor", "AutoScalerAdvisorAgent"),
+    (AgentType.BOTTLENECK_SCANNER, "agents.bottleneck_scanner", "BottleneckScannerAgent"),
+    (AgentType.SECURITY_RESPONDER, "agents.security_responder", "SecurityResponderAgent"),
+    (AgentType.CAPACITY_PLANNER, "agents.capacity_planner", "CapacityPlannerAgent"),
+    (AgentType.LOAD_SHIFTER, "agents.load_shifter", "LoadShifterAgent"),
+)
+
+
+def _load_agent_class(module_path: str, class_name: str) -> Type[BaseAgent]:
+    """Import an agent implementation by module path and class name."""
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _failure_result(error_message: str) -> AgentResult:
+    """Build a failed result that carries only an error message."""
+    return AgentResult(
+        success=False,
+        data={},
+        recommendations=[],
+        actions=[],
+        error_message=error_message
+    )
+
+
+_blocking_pool: Optional[ThreadPoolExecutor] = None
+_blocking_pool_lock = threading.Lock()
+
+
+def _get_blocking_pool(max_workers: Optional[int]) -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool that runs blocking agents.
+    
+    The pool is created on first use and shut down at interpreter exit.
+    
+    Args:
+        max_workers: Pool size, or None for twice the CPU count
+        
+    Returns:
+        Shared thread pool
+    """
+    global _blocking_pool
+    with _blocking_pool_lock:
+        if _blocking_pool is None:
+            _blocking_pool = ThreadPoolExecutor(
+                max_workers=max_workers or (os.cpu_count() or 1) * 2,
+                thread_name_prefix="agent"
+            )
+            atexit.register(_blocking_pool.shutdown)
+        return _blocking_pool
+
+
+def _run_blocking_agent(agent: BaseAgent, context: AgentContext) -> AgentResult:
+    """Run an agent to completion on its own event loop in a pool thread."""
+    return asyncio.run(agent.execute(context))
 
 
 class AgentRegistry(LoggerMixin):
@@ -32,32 +95,100 @@ class AgentRegistry(LoggerMixin):
     management.
     """
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, initialize_agents: bool = True):
+        """
+        Create the registry.
+        
+        Args:
+            settings: Platform settings shared with every agent
+            initialize_agents: Whether to construct the built-in agents now;
+                ``create()`` passes False and constructs them concurrently
+        """
         self.settings = settings
         self.agents: Dict[str, BaseAgent] = {}
-        self.agent_classes: Dict[AgentType, Type[BaseAgent]] = {
-            AgentType.BURST_PREDICTOR: BurstPredictorAgent,
-            AgentType.COST_WATCHER: CostWatcherAgent,
-            AgentType.ANOMALY_DETECTOR: AnomalyDetectorAgent,
-            AgentType.AUTO_SCALER_ADVISOR: AutoScalerAdvisorAgent,
-            AgentType.BOTTLENECK_SCANNER: BottleneckScannerAgent,
-            AgentType.SECURITY_RESPONDER: SecurityResponderAgent,
-            AgentType.CAPACITY_PLANNER: CapacityPlannerAgent,
-            AgentType.LOAD_SHIFTER: LoadShifterAgent,
+        
+        # Admission control shared by every batch; a condition over a counter
+        # lets max_concurrent_agents change while executions are in flight.
+        # The condition is made inside the running loop on first use, since
+        # on Python 3.9 it binds to whichever loop exists when constructed
+        self._admission_cv: Optional[asyncio.Condition] = None
+        self._admission_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        
+        # Health endpoints poll these views constantly; they are rebuilt at
+        # most once per TTL and dropped whenever the registry changes
+        self.view_cache_ttl = 1.0  # seconds
+        self._list_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Enabled agents indexed by name so batches skip disabled ones without
+        # scanning; kept current by the registry's enable/disable/register APIs
+        self._enabled: Dict[str, BaseAgent] = {}
+        
+        if initialize_agents:
+            self._initialize_agents()
+    
+    @cached_property
+    def agent_classes(self) -> Dict[AgentType, Type[BaseAgent]]:
+        """Get the built-in agent classes keyed by agent type (imports them all)."""
+        return {
+            agent_type: _load_agent_class(module_path, class_name)
+            for agent_type, module_path, class_name in _BUILTIN_AGENTS
         }
+    
+    @classmethod
+    async def create(cls, settings: Settings) -> "AgentRegistry":
+        """
+        Create a registry, constructing the built-in agents concurrently.
         
-        self._initialize_agents()
-        self.logger.info(f"AgentRegistry initialized with {len(self.agents)} agents")
+        Agent constructors load models and compile kernels, so building them
+        in worker threads keeps the event loop free and overlaps their I/O.
+        
+        Args:
+            settings: Platform settings shared with every agent
+            
+        Returns:
+            Initialized agent registry
+        """
+        registry = cls(settings, initialize_agents=False)
+        await registry._initialize_agents_async()
+        return registry
     
     def _initialize_agents(self) -> None:
         """Initialize all registered agents."""
-        for agent_type, agent_class in self.agent_classes.items():
-            try:
-                agent = agent_class(self.settings)
-                self.agents[agent.name] = agent
-                self.logger.info(f"Initialized agent: {agent.name}")
-            except Exception as e:
-                self.logger.error(f"Failed to initialize agent {agent_type.value}: {e}")
+        self._add_initialized_agents(
+            self._make_agent(*builtin) for builtin in _BUILTIN_AGENTS
+        )
+    
+    async def _initialize_agents_async(self) -> None:
+        """Initialize all registered agents concurrently in worker threads."""
+        agents = await asyncio.gather(*(
+            asyncio.to_thread(self._make_agent, *builtin) for builtin in _BUILTIN_AGENTS
+        ))
+        self._add_initialized_agents(agents)
+    
+    def _make_agent(self, agent_type: AgentType, module_path: str, class_name: str) -> Optional[BaseAgent]:
+        """Import and construct one agent, logging and returning None if it fails."""
+        try:
+            agent = _load_agent_class(module_path, class_name)(self.settings)
+        except Exception as e:
+            self.logger.error(f"Failed to initialize agent {agent_type.value}: {e}")
+            return None
+        
+        self.logger.info(f"Initialized agent: {agent.name}")
+        return agent
+    
+    def _add_initialized_agents(self, agents: Iterable[Optional[BaseAgent]]) -> None:
+        """Add freshly constructed agents in agent class order."""
+        for agent in agents:
+            if agent is None:
+                continue
+            self.agents[agent.name] = agent
+            if agent.enabled:
+                self._enabled[agent.name] = agent
+        
+        self._invalidate_views()
+        self.logger.info(f"AgentRegistry initialized with {len(self.agents)} agents")
     
     def get_agent(self, agent_name: str) -> Optional[BaseAgent]:
         """
@@ -78,7 +209,11 @@ class AgentRegistry(LoggerMixin):
         Returns:
             List of agent information dictionaries
         """
-        return [
+        now = time.monotonic()
+        if self._list_cache is not None and now - self._list_cache[0] < self.view_cache_ttl:
+            return self._list_cache[1]
+        
+        agents = [
             {
                 "name": agent.name,
                 "type": agent.agent_type.value,
@@ -89,15 +224,25 @@ class AgentRegistry(LoggerMixin):
             }
             for agent in self.agents.values()
         ]
+        self._list_cache = (now, agents)
+        return agents
+    
+    def _invalidate_views(self) -> None:
+        """Drop the cached agent listing and health summary."""
+        self._list_cache = None
+        self._health_cache = None
     
     def list_enabled_agents(self) -> List[BaseAgent]:
         """
         Get list of enabled agents.
         
+        Agents must be enabled and disabled through the registry for this
+        list to reflect them.
+        
         Returns:
             List of enabled agent instances
         """
-        return [agent for agent in self.agents.values() if agent.enabled]
+        return list(self._enabled.values())
     
     async def execute_agent(
         self,
@@ -114,69 +259,116 @@ class AgentRegistry(LoggerMixin):
         Returns:
             Agent execution result
         """
-        agent = self.get_agent(agent_name)
-        if not agent:
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message=f"Agent '{agent_name}' not found"
-            )
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return _failure_result(f"Agent '{agent_name}' not found")
         
-        if not agent.enabled:
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message=f"Agent '{agent_name}' is disabled"
-            )
+        # Nanosecond ids stay unique when one agent runs several times a second
+        context = self._build_context(context_data, f"{agent_name}_{time.time_ns()}", time.time())
+        return await self._execute_with_context(agent, context)
+    
+    def _build_context(self, context_data: Dict[str, Any], execution_id: str, timestamp: float) -> AgentContext:
+        """
+        Build an agent context from raw context data.
         
-        # Create agent context
-        context = AgentContext(
+        Args:
+            context_data: Context data keyed by section
+            execution_id: Identifier for this execution
+            timestamp: Execution timestamp
+            
+        Returns:
+            Agent execution context
+        """
+        return AgentContext(
             infrastructure_data=context_data.get("infrastructure", {}),
             metrics_data=context_data.get("metrics", {}),
             cost_data=context_data.get("cost", {}),
             security_data=context_data.get("security", {}),
             user_preferences=context_data.get("preferences", {}),
-            execution_id=f"{agent_name}_{int(datetime.utcnow().timestamp())}",
-            timestamp=datetime.utcnow().timestamp()
+            execution_id=execution_id,
+            timestamp=timestamp
         )
+    
+    async def _execute_with_context(self, agent: BaseAgent, context: AgentContext) -> AgentResult:
+        """
+        Execute an agent on an already built context.
         
-        # Validate context
-        if not await agent.validate_context(context):
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message="Invalid context data"
-            )
+        Args:
+            agent: Agent to execute
+            context: Agent execution context
+            
+        Returns:
+            Agent execution result
+        """
+        if not agent.enabled:
+            return _failure_result(f"Agent '{agent.name}' is disabled")
         
-        # Execute agent with timeout
+        # Validation and execution share one timeout so a hung validator
+        # cannot stall the caller either
         try:
-            result = await asyncio.wait_for(
-                agent.execute(context),
+            return await asyncio.wait_for(
+                self._validate_and_execute(agent, context),
                 timeout=self.settings.agent_timeout
             )
-            return result
         except asyncio.TimeoutError:
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message=f"Agent execution timed out after {self.settings.agent_timeout}s"
-            )
+            return _failure_result(f"Agent execution timed out after {self.settings.agent_timeout}s")
         except Exception as e:
-            return AgentResult(
-                success=False,
-                data={},
-                recommendations=[],
-                actions=[],
-                error_message=f"Agent execution failed: {str(e)}"
+            return _failure_result(f"Agent execution failed: {str(e)}")
+    
+    async def _validate_and_execute(self, agent: BaseAgent, context: AgentContext) -> AgentResult:
+        """Validate the context and run the agent on it."""
+        if not await agent.validate_context(context):
+            return _failure_result("Invalid context data")
+        
+        if agent.is_blocking:
+            # A timeout abandons the wait but cannot stop the pool thread
+            loop = asyncio.get_running_loop()
+            pool = _get_blocking_pool(self.settings.agent_threads)
+            return await loop.run_in_executor(pool, _run_blocking_agent, agent, context)
+        
+        return await agent.execute(context)
+    
+    def _admission_condition(self) -> asyncio.Condition:
+        """Get the admission condition for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._admission_loop is not loop:
+            self._admission_cv = asyncio.Condition()
+            self._admission_loop = loop
+        return self._admission_cv
+    
+    @asynccontextmanager
+    async def _admission_slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``max_concurrent_agents`` execution slots."""
+        admission_cv = self._admission_condition()
+        async with admission_cv:
+            await admission_cv.wait_for(
+                lambda: self._in_flight < self.settings.max_concurrent_agents
             )
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with admission_cv:
+                self._in_flight -= 1
+                admission_cv.notify(1)
+    
+    async def set_max_concurrent(self, limit: int) -> None:
+        """
+        Change how many agents may execute at once.
+        
+        Executions already running are unaffected; waiting ones are admitted
+        as soon as they fit under the new limit.
+        
+        Args:
+            limit: Maximum number of concurrent agent executions
+        """
+        if limit < 1:
+            raise ValueError("max_concurrent_agents must be at least 1")
+        
+        admission_cv = self._admission_condition()
+        async with admission_cv:
+            self.settings.max_concurrent_agents = limit
+            admission_cv.notify_all()
     
     async def execute_all_agents(self, context_data: Dict[str, Any]) -> Dict[str, AgentResult]:
         """
@@ -188,35 +380,90 @@ class AgentRegistry(LoggerMixin):
         Returns:
             Dictionary mapping agent names to their results
         """
+        return {
+            agent_name: result
+            async for agent_name, result in self.iter_execute_all_agents(context_data)
+        }
+    
+    async def iter_execute_all_agents(self, context_data: Dict[str, Any]) -> AsyncIterator[Tuple[str, AgentResult]]:
+        """
+        Execute all enabled agents, yielding each result as soon as it is ready.
+        
+        Args:
+            context_data: Context data for all agents
+            
+        Yields:
+            ``(agent_name, result)`` pairs in completion order
+        """
         enabled_agents = self.list_enabled_agents()
-        results = {}
+        if not enabled_agents:
+            return
         
-        # Execute agents concurrently with semaphore for limiting concurrency
-        semaphore = asyncio.Semaphore(self.settings.max_concurrent_agents)
+        # Every agent in the batch sees the same data, so the context is built
+        # once and each agent only gets its own execution id
+        base_context = self._build_context(context_data, "", time.time())
         
-        async def execute_single_agent(agent: BaseAgent) -> tuple[str, AgentResult]:
-            async with semaphore:
-                result = await self.execute_agent(agent.name, context_data)
+        async def execute_single_agent(agent: BaseAgent) -> Tuple[str, AgentResult]:
+            # Failures are turned into results here so every task yields a
+            # (name, result) pair and one bad agent cannot sink the batch
+            async with self._admission_slot():
+                try:
+                    context = dataclasses.replace(base_context, execution_id=f"{agent.name}_{time.time_ns()}")
+                    result = await self._execute_with_context(agent, context)
+                except Exception as e:
+                    result = _failure_result(f"Agent execution failed: {str(e)}")
                 return agent.name, result
         
-        # Execute all agents concurrently
-        tasks = [execute_single_agent(agent) for agent in enabled_agents]
-        agent_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        for agent_name, result in agent_results:
-            if isinstance(result, Exception):
-                results[agent_name] = AgentResult(
-                    success=False,
-                    data={},
-                    recommendations=[],
-                    actions=[],
-                    error_message=f"Agent execution failed: {str(result)}"
-                )
-            else:
-                results[agent_name] = result
+        # At most agent_batch_size tasks exist at once; each finished agent
+        # makes room for the next, so a slow agent never holds back a batch
+        window = self.settings.agent_batch_size
+        
+        # Bound the whole batch: agents run in waves no wider than the window
+        # or the concurrency limit, each wave bounded by agent_timeout, plus a
+        # grace period
+        waves = math.ceil(len(enabled_agents) / min(window, self.settings.max_concurrent_agents))
+        batch_timeout = waves * self.settings.agent_timeout + self.settings.agent_batch_grace_period
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + batch_timeout
+        
+        waiting = iter(enabled_agents)
+        running: Dict[asyncio.Task, str] = {}
         
-        return results
+        def launch(count: int) -> None:
+            for agent in itertools.islice(waiting, count):
+                running[asyncio.create_task(execute_single_agent(agent))] = agent.name
+        
+        try:
+            launch(window)
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=deadline - loop.time(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    del running[task]
+                    yield task.result()
+                launch(len(done))
+            
+            # Past the deadline: cancel stragglers, drain them without a time
+            # bound so none are leaked, then report everything undelivered
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            timed_out = f"Agent batch timed out after {batch_timeout}s"
+            for task, agent_name in running.items():
+                yield task.result() if not task.cancelled() else (agent_name, _failure_result(timed_out))
+            running.clear()
+            for agent in waiting:
+                yield agent.name, _failure_result(timed_out)
+        finally:
+            # A consumer that stops early must not leave agents running
+            for task in running:
+                if not task.done():
+                    task.cancel()
     
     def enable_agent(self, agent_name: str) -> bool:
         """
@@ -228,14 +475,16 @@ class AgentRegistry(LoggerMixin):
         Returns:
             True if successful, False otherwise
         """
-        agent = self.get_agent(agent_name)
-        if agent:
-            agent.enable()
-            self.logger.info(f"Enabled agent: {agent_name}")
-            return True
-        else:
+        agent = self.agents.get(agent_name)
+        if agent is None:
             self.logger.error(f"Agent not found: {agent_name}")
             return False
+        
+        agent.enable()
+        self._enabled[agent_name] = agent
+        self._invalidate_views()
+        self.logger.info(f"Enabled agent: {agent_name}")
+        return True
     
     def disable_agent(self, agent_name: str) -> bool:
         """
@@ -247,14 +496,16 @@ class AgentRegistry(LoggerMixin):
         Returns:
             True if successful, False otherwise
         """
-        agent = self.get_agent(agent_name)
-        if agent:
-            agent.disable()
-            self.logger.info(f"Disabled agent: {agent_name}")
-            return True
-        else:
+        agent = self.agents.get(agent_name)
+        if agent is None:
             self.logger.error(f"Agent not found: {agent_name}")
             return False
+        
+        agent.disable()
+        self._enabled.pop(agent_name, None)
+        self._invalidate_views()
+        self.logger.info(f"Disabled agent: {agent_name}")
+        return True
     
     def reset_agent(self, agent_name: str) -> bool:
         """
@@ -266,14 +517,15 @@ class AgentRegistry(LoggerMixin):
         Returns:
             True if successful, False otherwise
         """
-        agent = self.get_agent(agent_name)
-        if agent:
-            agent.reset()
-            self.logger.info(f"Reset agent: {agent_name}")
-            return True
-        else:
+        agent = self.agents.get(agent_name)
+        if agent is None:
             self.logger.error(f"Agent not found: {agent_name}")
             return False
+        
+        agent.reset()
+        self._invalidate_views()
+        self.logger.info(f"Reset agent: {agent_name}")
+        return True
     
     def get_agent_health(self, agent_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -285,10 +537,28 @@ class AgentRegistry(LoggerMixin):
         Returns:
             Health status dictionary or None if agent not found
         """
-        agent = self.get_agent(agent_name)
-        if agent:
-            return agent.get_health_status()
-        return None
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return None
+        return agent.get_health_status()
+    
+    def get_overall_health_summary(self) -> Dict[str, int]:
+        """
+        Get agent counts without per-agent health details.
+        
+        Only enabled agents are inspected, and no health dictionaries are
+        built, so this is cheap enough for liveness probes.
+        
+        Returns:
+            Total, enabled and healthy agent counts
+        """
+        return {
+            "total_agents": len(self.agents),
+            "enabled_agents": len(self._enabled),
+            "healthy_agents": sum(
+                1 for agent in self._enabled.values() if agent.status is not AgentStatus.ERROR
+            )
+        }
     
     def get_overall_health(self) -> Dict[str, Any]:
         """
@@ -297,11 +567,15 @@ class AgentRegistry(LoggerMixin):
         Returns:
             Overall health status
         """
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.view_cache_ttl:
+            return self._health_cache[1]
+        
         agents = list(self.agents.values())
         enabled_agents = [agent for agent in agents if agent.enabled]
         healthy_agents = [agent for agent in enabled_agents if agent.status.value != "error"]
         
-        return {
+        health = {
             "total_agents": len(agents),
             "enabled_agents": len(enabled_agents),
             "healthy_agents": len(healthy_agents),
@@ -310,6 +584,8 @@ class AgentRegistry(LoggerMixin):
                 for agent in agents
             }
         }
+        self._health_cache = (now, health)
+        return health
     
     def register_agent(self, agent: BaseAgent) -> bool:
         """
@@ -326,6 +602,9 @@ class AgentRegistry(LoggerMixin):
             return False
         
         self.agents[agent.name] = agent
+        if agent.enabled:
+            self._enabled[agent.name] = agent
+        self._invalidate_views()
         self.logger.info(f"Registered new agent: {agent.name}")
         return True
     
@@ -339,10 +618,11 @@ class AgentRegistry(LoggerMixin):
         Returns:
             True if successful, False otherwise
         """
-        if agent_name not in self.agents:
+        if self.agents.pop(agent_name, None) is None:
             self.logger.error(f"Agent '{agent_name}' not found")
             return False
         
-        del self.agents[agent_name]
+        self._enabled.pop(agent_name, None)
+        self._invalidate_views()
         self.logger.info(f"Unregistered agent: {agent_name}")
         return True
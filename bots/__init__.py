@@ -5,9 +5,22 @@ This module provides Telegram and Slack bot interfaces for interacting
 with the platform and its AI agents.
 """
 
+import importlib
+
 from .gateway import BotGateway
-from .telegram_bot import TelegramBot
-from .slack_bot import SlackBot
 
 __version__ = "1.0.0"
 __all__ = ["BotGateway", "TelegramBot", "SlackBot"]
+
+# The bots pull in their SDKs, so they are only imported when first used;
+# the gateway imports them itself for the channels that are configured
+_LAZY_BOTS = {
+    "TelegramBot": ".telegram_bot",
+    "SlackBot": ".slack_bot",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_BOTS:
+        return getattr(importlib.import_module(_LAZY_BOTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,9 @@ a unified interface for Telegram and Slack bots.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from core.logging import LoggerMixin
@@ -14,6 +16,71 @@ from core.config import Settings
 from agents.registry import AgentRegistry
 
 
+# Shared by the gateway and the bots so every channel shows the same text
+HELP_TEXT = """
+🤖 **DevOps AI Platform Commands**
+
+**Status & Monitoring**:
+• `/status` - Platform health and agent status
+• `/cost` - Cost analysis and spending breakdown
+• `/analysis` - AI-powered infrastructure analysis
+• `/anomaly` - Anomaly detection results
+• `/predict` - Traffic predictions
+
+**Agent Control**:
+• `/agent <name> status` - Get agent status
+• `/agent <name> analyze` - Run agent analysis
+• `/agent <name> optimize` - Run agent optimization
+
+**Operations**:
+• `/approve <pr-id>` - Approve agent-generated PR
+• `/scale <service> <replicas>` - Scale deployment
+• `/logs <pod>` - Get pod logs
+• `/alerts` - Show current alerts
+• `/run test <service>` - Run synthetic test
+• `/graph <panel>` - Get Grafana graph
+
+**Help**:
+• `/help` - Show this help message
+"""
+
+
+# Commands waiting to be recorded by the audit worker; past this many,
+# new records are dropped rather than delaying replies
+_AUDIT_QUEUE_SIZE = 10_000
+
+# Shared stand-ins for missing sections of agent results; only ever read
+_EMPTY: Dict[str, Any] = {}
+_NO_ITEMS: tuple = ()
+
+# Alert prefix per priority; unknown priorities use the "normal" indicator
+PRIORITY_INDICATORS = {
+    "low": "ℹ️",
+    "normal": "⚠️",
+    "high": "🚨",
+    "critical": "🔥"
+}
+
+
+def format_alert(priority: str, message: str, label: Optional[str] = None) -> str:
+    """
+    Prefix an alert message with its priority indicator.
+    
+    Args:
+        priority: Alert priority (low, normal, high, critical)
+        message: Alert message
+        label: Optional marker placed between the indicator and the message,
+            already in the target channel's markup (e.g. ``*ALERT*``)
+        
+    Returns:
+        Formatted alert message
+    """
+    indicator = PRIORITY_INDICATORS.get(priority, "⚠️")
+    if label:
+        return f"{indicator} {label}: {message}"
+    return f"{indicator} {message}"
+
+
 class BotGateway(LoggerMixin):
     """
     Bot Gateway for managing bot interactions and routing.
@@ -27,17 +94,51 @@ class BotGateway(LoggerMixin):
         self.agent_registry = agent_registry
         self.connection_count = 0
         self.active_connections = {}
-        self.command_history = []
+        # Only the most recent commands are kept so history cannot grow
+        # without bound in a long-running process
+        self.command_history: Deque[Dict[str, Any]] = deque(maxlen=settings.command_history_size)
+        
+        # While the gateway runs, history and command logging happen on a
+        # background worker so slow log handlers do not delay replies
+        self._audit_queue: Optional[asyncio.Queue] = None
+        self._audit_task: Optional[asyncio.Task] = None
+        self._dropped_audit_records = 0
+        
+        # Agent listing and overall health as last read for /status, so
+        # repeated polls within the TTL do not each hit the registry
+        self._status_cache: Optional[Tuple[float, List[Dict[str, Any]], Dict[str, Any]]] = None
         
         # Initialize bot handlers
         self.telegram_bot = None
         self.slack_bot = None
         
+        # Commands are routed on their first word with one dict lookup;
+        # handlers that take arguments get the remaining words
+        self._commands: Dict[str, Callable[[], Awaitable[str]]] = {
+            "status": self._handle_status_command,
+            "cost": self._handle_cost_command,
+            "analysis": self._handle_analysis_command,
+            "anomaly": self._handle_anomaly_command,
+            "predict": self._handle_predict_command,
+            "alerts": self._handle_alerts_command,
+        }
+        self._arg_commands: Dict[str, Callable[[List[str]], Awaitable[str]]] = {
+            "agent": self._handle_agent_command,
+            "approve": self._handle_approve_command,
+            "scale": self._handle_scale_command,
+            "logs": self._handle_logs_command,
+            "run": self._handle_run_command,
+            "graph": self._handle_graph_command,
+        }
+        
         self.logger.info("BotGateway initialized")
     
     async def start(self) -> None:
         """Start the bot gateway and all bot handlers."""
         try:
+            self._audit_queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_SIZE)
+            self._audit_task = asyncio.create_task(self._audit_worker())
+            
             # Start Telegram bot if configured
             if self.settings.telegram_bot_token:
                 from bots.telegram_bot import TelegramBot
@@ -74,6 +175,8 @@ class BotGateway(LoggerMixin):
                 await self.slack_bot.stop()
                 self.logger.info("✅ Slack bot stopped")
             
+            await self._stop_audit_worker()
+            
             self.logger.info("✅ Bot gateway stopped")
             
         except Exception as e:
@@ -92,70 +195,96 @@ class BotGateway(LoggerMixin):
         Args:
             bot_type: Type of bot (telegram, slack)
             user_id: User ID
-            command: Command string
-            args: Command arguments
+            command: Command string, optionally followed by its arguments
+            args: Command arguments; taken from the words after the command
+                name when not given
             
         Returns:
             Response message
         """
+        start_time = time.perf_counter()
+        record = {
+            "bot_type": bot_type,
+            "user_id": user_id,
+            "command": command,
+            "args": args,
+            "timestamp": datetime.now()
+        }
+        
         try:
-            start_time = datetime.now()
-            
-            # Log command
-            self.command_history.append({
-                "bot_type": bot_type,
-                "user_id": user_id,
-                "command": command,
-                "args": args,
-                "timestamp": datetime.now()
-            })
-            
-            # Parse command
+            # Parse command; only the name is needed to pick a handler
             if command.startswith("/"):
                 command = command[1:]  # Remove leading slash
             
+            name, _, tail = command.partition(" ")
+            
             # Route to appropriate handler
-            if command == "status":
-                response = await self._handle_status_command()
-            elif command == "cost":
-                response = await self._handle_cost_command()
-            elif command == "analysis":
-                response = await self._handle_analysis_command()
-            elif command == "anomaly":
-                response = await self._handle_anomaly_command()
-            elif command == "predict":
-                response = await self._handle_predict_command()
-            elif command.startswith("agent"):
-                response = await self._handle_agent_command(args)
-            elif command.startswith("approve"):
-                response = await self._handle_approve_command(args)
-            elif command.startswith("scale"):
-                response = await self._handle_scale_command(args)
-            elif command.startswith("logs"):
-                response = await self._handle_logs_command(args)
-            elif command == "alerts":
-                response = await self._handle_alerts_command()
-            elif command.startswith("run"):
-                response = await self._handle_run_command(args)
-            elif command.startswith("graph"):
-                response = await self._handle_graph_command(args)
-            elif command == "help":
+            if name in self._commands:
+                response = await self._commands[name]()
+            elif name in self._arg_commands:
+                if args is None:
+                    args = tail.split()
+                response = await self._arg_commands[name](args)
+            elif name == "help":
                 response = self._handle_help_command()
             else:
                 response = f"❌ Unknown command: {command}\nUse /help for available commands."
             
-            # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            # Log response
-            self.logger.info(f"Command '{command}' executed in {execution_time:.2f}s")
+            # Record the command without waiting on the log handlers
+            self._audit(record, time.perf_counter() - start_time)
             
             return response
             
         except Exception as e:
+            self._audit(record, time.perf_counter() - start_time)
             self.logger.error(f"Error handling command '{command}': {e}")
             return f"❌ Error executing command: {str(e)}"
     
+    def _audit(self, record: Dict[str, Any], execution_time: float) -> None:
+        """
+        Record a handled command in the history and the log.
+        
+        Args:
+            record: Command that was handled
+            execution_time: Seconds spent handling it
+        """
+        if self._audit_queue is None:
+            self._record_command(record, execution_time)
+            return
+        
+        try:
+            self._audit_queue.put_nowait((record, execution_time))
+        except asyncio.QueueFull:
+            self._dropped_audit_records += 1
+            if self._dropped_audit_records == 1:
+                self.logger.warning("Command audit queue is full; dropping command records")
+    
+    def _record_command(self, record: Dict[str, Any], execution_time: float) -> None:
+        """Append a command to the history and log how long it took."""
+        self.command_history.append(record)
+        self.logger.info(f"Command '{record['command']}' executed in {execution_time:.2f}s")
+    
+    async def _audit_worker(self) -> None:
+        """Record queued commands until cancelled."""
+        while True:
+            record, execution_time = await self._audit_queue.get()
+            self._record_command(record, execution_time)
+    
+    async def _stop_audit_worker(self) -> None:
+        """Stop the audit worker and record whatever it had not reached."""
+        if self._audit_task is not None:
+            self._audit_task.cancel()
+            try:
+                await self._audit_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_task = None
+        
+        if self._audit_queue is not None:
+            while not self._audit_queue.empty():
+                self._record_command(*self._audit_queue.get_nowait())
+            self._audit_queue = None
+    
     async def send_alert(self, message: str, priority: str = "normal") -> None:
         """
         Send alert message to all connected bots.
@@ -165,30 +294,30 @@ class BotGateway(LoggerMixin):
             priority: Alert priority (low, normal, high, critical)
         """
         try:
-            # Add priority indicator
-            priority_indicators = {
-                "low": "ℹ️",
-                "normal": "⚠️",
-                "high": "🚨",
-                "critical": "🔥"
-            }
-            
-            indicator = priority_indicators.get(priority, "⚠️")
-            formatted_message = f"{indicator} {message}"
-            
-            # Send to Telegram
+            formatted_message = format_alert(priority, message)
+            
+            # Deliver to every connected channel concurrently; one failing
+            # channel does not stop the others
+            channels = []
+            sends = []
             if self.telegram_bot and self.settings.telegram_chat_id:
-                await self.telegram_bot.send_message(
+                channels.append("Telegram")
+                sends.append(self.telegram_bot.send_message(
                     self.settings.telegram_chat_id,
                     formatted_message
-                )
-            
-            # Send to Slack
+                ))
             if self.slack_bot:
-                await self.slack_bot.send_message(
+                # Slack coalesces bursts of alerts into one post per channel
+                channels.append("Slack")
+                sends.append(self.slack_bot.queue_message(
                     self.settings.slack_channel,
                     formatted_message
-                )
+                ))
+            
+            outcomes = await asyncio.gather(*sends, return_exceptions=True)
+            for channel, outcome in zip(channels, outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Error sending {channel} alert: {outcome}")
             
             self.logger.info(f"Alert sent: {message}")
             
@@ -199,37 +328,61 @@ class BotGateway(LoggerMixin):
         """Handle /status command."""
         try:
             # Get platform status
-            agents = self.agent_registry.list_agents()
-            enabled_agents = [a for a in agents if a.get("enabled", False)]
-            healthy_agents = [a for a in enabled_agents if a.get("health", {}).get("status") == "idle"]
-            
-            # Get overall health
-            overall_health = self.agent_registry.get_overall_health()
-            
-            status_message = f"""
+            agents, overall_health = self._get_status_snapshot()
+            
+            # Count and pick the agents to show in one pass over the listing
+            enabled_count = healthy_count = 0
+            shown = []
+            for agent in agents:
+                if not agent.get("enabled", False):
+                    continue
+                enabled_count += 1
+                health = agent.get("health") or {}
+                if health.get("status") == "idle":
+                    healthy_count += 1
+                if len(shown) < 5:  # Show top 5 agents
+                    shown.append((agent, health))
+            
+            parts = [f"""
 🟢 **Platform Status**
 
-**Agents**: {len(healthy_agents)}/{len(enabled_agents)} healthy
+**Agents**: {healthy_count}/{enabled_count} healthy
 **Overall Health**: {overall_health.get('status', 'unknown')}
 
 **Active Agents**:
-"""
+"""]
             
-            for agent in enabled_agents[:5]:  # Show top 5 agents
-                health = agent.get("health", {})
+            for agent, health in shown:
                 status = health.get("status", "unknown")
                 status_emoji = "🟢" if status == "idle" else "🟡" if status == "running" else "🔴"
                 
-                status_message += f"{status_emoji} {agent['name']}: {status}\n"
+                parts.append(f"{status_emoji} {agent['name']}: {status}\n")
             
-            if len(enabled_agents) > 5:
-                status_message += f"... and {len(enabled_agents) - 5} more agents\n"
+            if enabled_count > len(shown):
+                parts.append(f"... and {enabled_count - len(shown)} more agents\n")
             
-            return status_message
+            return "".join(parts)
             
         except Exception as e:
             return f"❌ Error getting status: {str(e)}"
     
+    def _get_status_snapshot(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get the agent listing and overall health used by /status.
+        
+        Returns:
+            Tuple of (agent listing, overall health), at most
+            ``status_cache_ttl`` seconds old
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < self.settings.status_cache_ttl:
+            return self._status_cache[1], self._status_cache[2]
+        
+        agents = self.agent_registry.list_agents()
+        overall_health = self.agent_registry.get_overall_health()
+        self._status_cache = (now, agents, overall_health)
+        return agents, overall_health
+    
     async def _handle_cost_command(self) -> str:
         """Handle /cost command."""
         try:
@@ -237,26 +390,26 @@ class BotGateway(LoggerMixin):
             result = await self.agent_registry.execute_agent("cost_watcher", {})
             
             if result.success:
-                data = result.data.get("analysis", {})
-                current_spending = data.get("current_spending", {})
+                data = result.data.get("analysis") or _EMPTY
+                current_spending = data.get("current_spending") or _EMPTY
                 
                 total_cost = current_spending.get("total_cost", 0.0)
                 daily_avg = current_spending.get("daily_average", 0.0)
                 
-                cost_message = f"""
+                parts = [f"""
 💰 **Cost Analysis**
 
 **Total Cost (30 days)**: ${total_cost:.2f}
 **Daily Average**: ${daily_avg:.2f}
 
 **Top Services**:
-"""
+"""]
                 
-                top_services = data.get("top_services", [])
+                top_services = data.get("top_services") or _NO_ITEMS
                 for service, cost in top_services[:3]:
-                    cost_message += f"• {service}: ${cost:.2f}\n"
+                    parts.append(f"• {service}: ${cost:.2f}\n")
                 
-                return cost_message
+                return "".join(parts)
             else:
                 return f"❌ Cost analysis failed: {result.error_message}"
                 
@@ -266,29 +419,36 @@ class BotGateway(LoggerMixin):
     async def _handle_analysis_command(self) -> str:
         """Handle /analysis command."""
         try:
-            # Execute multiple agents for comprehensive analysis
+            # The agents are independent, so run them concurrently
             agents_to_run = ["burst_predictor", "anomaly_detector", "cost_watcher"]
-            results = {}
+            outcomes = await asyncio.gather(
+                *(self.agent_registry.execute_agent(agent_name, {}) for agent_name in agents_to_run),
+                return_exceptions=True
+            )
             
-            for agent_name in agents_to_run:
-                result = await self.agent_registry.execute_agent(agent_name, {})
-                results[agent_name] = result
+            # An agent that raised is reported like one that failed
+            results = {}
+            for agent_name, outcome in zip(agents_to_run, outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(f"Agent '{agent_name}' failed during analysis: {outcome}")
+                else:
+                    results[agent_name] = outcome
             
-            analysis_message = "🤖 **AI Analysis Results**\n\n"
+            parts = ["🤖 **AI Analysis Results**\n\n"]
             
             for agent_name, result in results.items():
                 if result.success:
                     recommendations = result.recommendations
                     if recommendations:
-                        analysis_message += f"**{agent_name.replace('_', ' ').title()}**:\n"
+                        parts.append(f"**{agent_name.replace('_', ' ').title()}**:\n")
                         for rec in recommendations[:2]:  # Show top 2 recommendations
-                            analysis_message += f"• {rec.get('title', 'Recommendation')}\n"
-                        analysis_message += "\n"
+                            parts.append(f"• {rec.get('title', 'Recommendation')}\n")
+                        parts.append("\n")
             
             if not any(r.success for r in results.values()):
-                analysis_message += "No analysis results available."
+                parts.append("No analysis results available.")
             
-            return analysis_message
+            return "".join(parts)
             
         except Exception as e:
             return f"❌ Error running analysis: {str(e)}"
@@ -299,11 +459,13 @@ class BotGateway(LoggerMixin):
             result = await self.agent_registry.execute_agent("anomaly_detector", {})
             
             if result.success:
-                anomalies = result.data.get("anomalies", [])
+                anomalies = result.data.get("anomalies") or _NO_ITEMS
                 
                 if anomalies:
-                    anomaly_message = f"⚠️ **Anomaly Detection Results**\n\n"
-                    anomaly_message += f"Found {len(anomalies)} anomalies:\n\n"
+                    parts = [
+                        "⚠️ **Anomaly Detection Results**\n\n",
+                        f"Found {len(anomalies)} anomalies:\n\n"
+                    ]
                     
                     for anomaly in anomalies[:3]:  # Show top 3 anomalies
                         metric = anomaly.get("metric", "unknown")
@@ -311,10 +473,12 @@ class BotGateway(LoggerMixin):
                         value = anomaly.get("value", 0)
                         
                         severity_emoji = "🔴" if severity == "high" else "🟡"
-                        anomaly_message += f"{severity_emoji} **{metric}**: {value} ({severity})\n"
+                        parts.append(f"{severity_emoji} **{metric}**: {value} ({severity})\n")
                     
                     if len(anomalies) > 3:
-                        anomaly_message += f"\n... and {len(anomalies) - 3} more anomalies"
+                        parts.append(f"\n... and {len(anomalies) - 3} more anomalies")
+                    
+                    anomaly_message = "".join(parts)
                 else:
                     anomaly_message = "✅ No anomalies detected"
                 
@@ -331,10 +495,10 @@ class BotGateway(LoggerMixin):
             result = await self.agent_registry.execute_agent("burst_predictor", {})
             
             if result.success:
-                predictions = result.data.get("predictions", [])
+                predictions = result.data.get("predictions") or _NO_ITEMS
                 
                 if predictions:
-                    predict_message = "📈 **Traffic Predictions**\n\n"
+                    parts = ["📈 **Traffic Predictions**\n\n"]
                     
                     for prediction in predictions[:3]:  # Show top 3 predictions
                         timestamp = prediction.get("timestamp", "unknown")
@@ -342,8 +506,10 @@ class BotGateway(LoggerMixin):
                         confidence = prediction.get("confidence", 0)
                         burst_prob = prediction.get("burst_probability", 0)
                         
-                        predict_message += f"**{timestamp}**: {predicted_value:.0f} req/s\n"
-                        predict_message += f"Confidence: {confidence:.1%}, Burst Probability: {burst_prob:.1%}\n\n"
+                        parts.append(f"**{timestamp}**: {predicted_value:.0f} req/s\n")
+                        parts.append(f"Confidence: {confidence:.1%}, Burst Probability: {burst_prob:.1%}\n\n")
+                    
+                    predict_message = "".join(parts)
                 else:
                     predict_message = "No predictions available"
                 
@@ -461,29 +627,4 @@ class BotGateway(LoggerMixin):
     
     def _handle_help_command(self) -> str:
         """Handle /help command."""
-        return """
-🤖 **DevOps AI Platform Commands**
-
-**Status & Monitoring**:
-• `/status` - Platform health and agent status
-• `/cost` - Cost analysis and spending breakdown
-• `/analysis` - AI-powered infrastructure analysis
-• `/anomaly` - Anomaly detection results
-• `/predict` - Traffic predictions
-
-**Agent Control**:
-• `/agent <name> status` - Get agent status
-• `/agent <name> analyze` - Run agent analysis
-• `/agent <name> optimize` - Run agent optimization
-
-**Operations**:
-• `/approve <pr-id>` - Approve agent-generated PR
-• `/scale <service> <replicas>` - Scale deployment
-• `/logs <pod>` - Get pod logs
-• `/alerts` - Show current alerts
-• `/run test <service>` - Run synthetic test
-• `/graph <panel>` - Get Grafana graph
-
-**Help**:
-• `/help` - Show this help message
-"""
+        return HELP_TEXT
@@ -6,7 +6,9 @@ the platform and its AI agents.
 """
 
 import asyncio
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
+import aiohttp
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
@@ -14,7 +16,13 @@ from slack_sdk.socket_mode.response import SocketModeResponse
 
 from core.logging import LoggerMixin
 from core.config import Settings
-from bots.gateway import BotGateway
+from bots.gateway import BotGateway, format_alert
+
+
+# Alerts queued for a channel within one flush interval are posted together,
+# up to this many per message
+_ALERT_FLUSH_INTERVAL = 0.2  # seconds
+_MAX_ALERTS_PER_MESSAGE = 20
 
 
 class SlackBot(LoggerMixin):
@@ -32,11 +40,26 @@ class SlackBot(LoggerMixin):
         self.socket_client: Optional[AsyncBaseSocketModeClient] = None
         self.running = False
         
+        # HTTP session owned by the bot while it runs, so Web API calls keep
+        # their connections alive instead of paying a TLS handshake each time
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Alerts waiting to be posted, by channel; a flush is scheduled when
+        # the first one is queued and runs until nothing is left
+        self._pending: Dict[str, List[str]] = defaultdict(list)
+        self._flush_task: Optional[asyncio.Task] = None
+        
         self.logger.info("SlackBot initialized")
     
     async def start(self) -> None:
         """Start the Slack bot."""
         try:
+            # Share one keep-alive session across every Web API call
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+            )
+            self.client = AsyncWebClient(token=self.settings.slack_bot_token, session=self._session)
+            
             # Initialize socket mode client
             self.socket_client = AsyncBaseSocketModeClient(
                 app_token=self.settings.slack_bot_token,
@@ -54,6 +77,7 @@ class SlackBot(LoggerMixin):
             
         except Exception as e:
             self.logger.error(f"❌ Failed to start Slack bot: {e}")
+            await self._close_session()
             raise
     
     async def stop(self) -> None:
@@ -65,12 +89,29 @@ class SlackBot(LoggerMixin):
             if self.socket_client:
                 await self.socket_client.stop()
             
+            # Alerts from here on are posted directly; let the pending flush
+            # deliver what was queued before the session goes away
             self.running = False
+            if self._flush_task is not None:
+                await self._flush_task
+            
+            await self._close_session()
+            
             self.logger.info("✅ Slack bot stopped")
             
         except Exception as e:
             self.logger.error(f"❌ Error stopping Slack bot: {e}")
     
+    async def _close_session(self) -> None:
+        """Close the shared HTTP session and fall back to a standalone client."""
+        if self._session is None:
+            return
+        
+        await self._session.close()
+        self._session = None
+        # Messages sent while stopped must not reuse the closed session
+        self.client = AsyncWebClient(token=self.settings.slack_bot_token)
+    
     async def _handle_socket_request(self, client: AsyncBaseSocketModeClient, req: SocketModeRequest) -> None:
         """Handle socket mode requests."""
         try:
@@ -124,7 +165,8 @@ class SlackBot(LoggerMixin):
             channel = event.get("channel", "")
             
             # Remove bot mention from text
-            command = text.split(">", 1)[1].strip() if ">" in text else text
+            _, sep, rest = text.partition(">")
+            command = rest.strip() if sep else text
             
             if command.startswith("/"):
                 response = await self.gateway.handle_command("slack", user_id, command)
@@ -168,6 +210,28 @@ Use `/help` to see all available commands, or try:
         except Exception as e:
             self.logger.error(f"Error sending Slack message: {e}")
     
+    async def _flush_later(self) -> None:
+        """Post queued alerts after the flush interval, until none are left."""
+        while True:
+            await asyncio.sleep(_ALERT_FLUSH_INTERVAL)
+            await self._flush()
+            
+            # Alerts queued while posting are picked up by another round
+            if not self._pending:
+                self._flush_task = None
+                return
+    
+    async def _flush(self) -> None:
+        """Post all queued alerts, one message per channel and batch."""
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, defaultdict(list)
+        for channel, messages in pending.items():
+            for start in range(0, len(messages), _MAX_ALERTS_PER_MESSAGE):
+                batch = messages[start:start + _MAX_ALERTS_PER_MESSAGE]
+                await self._send_message(channel, "\n".join(batch))
+    
     async def send_message(self, channel: str, message: str) -> None:
         """
         Send a message to a specific channel.
@@ -178,6 +242,25 @@ Use `/help` to see all available commands, or try:
         """
         await self._send_message(channel, message)
     
+    async def queue_message(self, channel: str, message: str) -> None:
+        """
+        Send a message to a channel, batched with others queued alongside it.
+        
+        While the bot runs, messages queued for a channel within one flush
+        interval are posted together; otherwise the message is sent at once.
+        
+        Args:
+            channel: Slack channel name or ID
+            message: Message to send
+        """
+        if not self.running:
+            await self.send_message(channel, message)
+            return
+        
+        self._pending[channel].append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
     async def send_alert(self, channel: str, message: str, priority: str = "normal") -> None:
         """
         Send an alert message to a specific channel.
@@ -188,18 +271,10 @@ Use `/help` to see all available commands, or try:
             priority: Alert priority
         """
         try:
-            # Add priority indicator
-            priority_indicators = {
-                "low": "ℹ️",
-                "normal": "⚠️",
-                "high": "🚨",
-                "critical": "🔥"
-            }
-            
-            indicator = priority_indicators.get(priority, "⚠️")
-            formatted_message = f"{indicator} *ALERT*: {message}"
-            
-            await self.send_message(channel, formatted_message)
+            formatted_message = format_alert(priority, message, "*ALERT*")
+            
+            # Bursts of alerts share one post
+            await self.queue_message(channel, formatted_message)
             
         except Exception as e:
             self.logger.error(f"Error sending Slack alert: {e}")
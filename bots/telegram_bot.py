@@ -12,7 +12,7 @@ from telegram.ext import Application, CommandHandler, MessageHandler, filters, C
 
 from core.logging import LoggerMixin
 from core.config import Settings
-from bots.gateway import BotGateway
+from bots.gateway import BotGateway, HELP_TEXT, format_alert
 
 
 class TelegramBot(LoggerMixin):
@@ -120,34 +120,7 @@ Use `/help` to see all available commands.
     
     async def _handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
-        help_message = """
-🤖 **DevOps AI Platform Commands**
-
-**Status & Monitoring**:
-• `/status` - Platform health and agent status
-• `/cost` - Cost analysis and spending breakdown
-• `/analysis` - AI-powered infrastructure analysis
-• `/anomaly` - Anomaly detection results
-• `/predict` - Traffic predictions
-
-**Agent Control**:
-• `/agent <name> status` - Get agent status
-• `/agent <name> analyze` - Run agent analysis
-• `/agent <name> optimize` - Run agent optimization
-
-**Operations**:
-• `/approve <pr-id>` - Approve agent-generated PR
-• `/scale <service> <replicas>` - Scale deployment
-• `/logs <pod>` - Get pod logs
-• `/alerts` - Show current alerts
-• `/run test <service>` - Run synthetic test
-• `/graph <panel>` - Get Grafana graph
-
-**Help**:
-• `/help` - Show this help message
-"""
-        
-        await update.message.reply_text(help_message, parse_mode='Markdown')
+        await update.message.reply_text(HELP_TEXT, parse_mode='Markdown')
     
     async def _handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
@@ -282,16 +255,7 @@ Use `/help` to see all available commands, or try:
             priority: Alert priority
         """
         try:
-            # Add priority indicator
-            priority_indicators = {
-                "low": "ℹ️",
-                "normal": "⚠️",
-                "high": "🚨",
-                "critical": "🔥"
-            }
-            
-            indicator = priority_indicators.get(priority, "⚠️")
-            formatted_message = f"{indicator} **ALERT**: {message}"
+            formatted_message = format_alert(priority, message, "**ALERT**")
             
             await self.send_message(chat_id, formatted_message)
             
@@ -73,6 +73,9 @@ class Settings(BaseSettings):
     agent_execution_interval: int = Field(default=300, env="AGENT_EXECUTION_INTERVAL")
     agent_timeout: int = Field(default=60, env="AGENT_TIMEOUT")
     max_concurrent_agents: int = Field(default=10, env="MAX_CONCURRENT_AGENTS")
+    agent_batch_size: int = Field(default=16, env="AGENT_BATCH_SIZE")
+    agent_batch_grace_period: int = Field(default=5, env="AGENT_BATCH_GRACE_PERIOD")
+    agent_threads: Optional[int] = Field(default=None, env="AGENT_THREADS")
     
     # Notification Configuration
     alert_email: str = Field(default="alerts@yourcompany.com", env="ALERT_EMAIL")
@@ -83,6 +86,8 @@ class Settings(BaseSettings):
     max_workers: int = Field(default=4, env="MAX_WORKERS")
     worker_timeout: int = Field(default=30, env="WORKER_TIMEOUT")
     cache_ttl: int = Field(default=300, env="CACHE_TTL")
+    command_history_size: int = Field(default=1000, env="COMMAND_HISTORY_SIZE")
+    status_cache_ttl: float = Field(default=5.0, env="STATUS_CACHE_TTL")
     
     # Development Configuration
     enable_mock_mode: bool = Field(default=False, env="ENABLE_MOCK_MODE")
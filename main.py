@@ -19,7 +19,7 @@ import uvicorn
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from dotenv import load_dotenv
 import secrets
@@ -90,7 +90,7 @@ async def lifespan(app: FastAPI):
         logger.info("✅ Monitoring setup complete")
         
         # Initialize agent registry
-        agent_registry = AgentRegistry(settings)
+        agent_registry = await AgentRegistry.create(settings)
         app_state["agent_registry"] = agent_registry
         logger.info("✅ Agent registry initialized")
         
@@ -207,6 +207,15 @@ async def health_check():
         )
 
 
+@app.get("/healthz")
+async def healthz():
+    """Lightweight agent health summary for frequent probes."""
+    if "agent_registry" not in app_state:
+        return JSONResponse(status_code=503, content={"status": "unavailable"})
+    
+    return app_state["agent_registry"].get_overall_health_summary()
+
+
 @app.get("/agents")
 async def list_agents():
     """List all available agents."""
@@ -225,7 +234,7 @@ async def execute_agent(agent_name: str, context: Dict[str, Any] = None, current
     
     try:
         result = await app_state["agent_registry"].execute_agent(agent_name, context or {})
-        return {"agent": agent_name, "result": result}
+        return ORJSONResponse({"agent": agent_name, "result": result.to_dict()})
     except Exception as e:
         logger.error(f"Agent execution failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -248,19 +257,23 @@ async def restart_agent(agent_name: str, current_user: str = Depends(get_current
         
         # Disable the agent temporarily and set status to restarting
         was_enabled = agent.enabled
-        agent.disable()
+        agent_registry.disable_agent(agent_name)
         # Add a temporary restarting flag to the agent
         agent._restarting = True
         
-        # Reinitialize the agent
+        # Reinitialize the agent and swap it in under the same name
         new_agent = agent.__class__(agent_registry.settings)
+        agent_registry.unregister_agent(agent_name)
         agent_registry.register_agent(new_agent)
         
-        # Re-enable the agent if it was enabled before
+        # Re-enable the agent if it was enabled before; going through the
+        # registry keeps its enabled index in step
         if was_enabled:
-            new_agent.enable()
+            agent_registry.enable_agent(agent_name)
             new_agent.status = AgentStatus.IDLE  # Set back to idle after restart
             new_agent._restarting = False  # Clear restarting flag
+        else:
+            agent_registry.disable_agent(agent_name)
         
         logger.info(f"Agent '{agent_name}' restarted successfully")
         return {
@@ -290,11 +303,11 @@ async def toggle_agent(agent_name: str, current_user: str = Depends(get_current_
         
         # Toggle the agent state
         if agent.enabled:
-            agent.disable()
+            agent_registry.disable_agent(agent_name)
             status = "disabled"
             message = f"Agent '{agent_name}' has been disabled"
         else:
-            agent.enable()
+            agent_registry.enable_agent(agent_name)
             status = "enabled"
             message = f"Agent '{agent_name}' has been enabled and is now running"
         
@@ -356,7 +369,7 @@ async def delete_agent(agent_name: str, current_user: str = Depends(get_current_
         agent = agent_registry.agents[agent_name]
         
         # Disable the agent
-        agent.disable()
+        agent_registry.disable_agent(agent_name)
         
         # Remove from registry
         agent_registry.unregister_agent(agent_name)
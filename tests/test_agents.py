@@ -7,13 +7,27 @@ unit tests, integration tests, and performance tests.
 
 import pytest
 import asyncio
+import threading
+import dataclasses
+import json
+import os
+import subprocess
+import sys
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime
+from datetime import date, datetime
 
-from agents.base import AgentContext, AgentResult, AgentType
+import numpy as np
+from botocore.exceptions import ClientError
+
+from agents import kernels
+from agents.base import AgentContext, AgentResult, AgentStatus, AgentType
 from agents.burst_predictor import BurstPredictorAgent
 from agents.cost_watcher import CostWatcherAgent
 from agents.anomaly_detector import AnomalyDetectorAgent
+from agents.auto_scaler_advisor import AutoScalerAdvisorAgent
+from agents.capacity_planner import CapacityPlannerAgent
+from agents.load_shifter import LoadShifterAgent
+from agents.registry import AgentRegistry
 from core.config import Settings
 
 
@@ -89,6 +103,116 @@ class TestBurstPredictorAgent:
         assert result.success is False
         assert "No traffic data available" in result.error_message
     
+    @pytest.mark.asyncio
+    async def test_analyze_reports_helper_failure(self, agent, context):
+        """Test errors in the numeric helpers surface as a failed analysis."""
+        with patch.object(agent, "_predict_traffic_bursts", side_effect=ValueError("bad series")):
+            result = await agent.analyze(context)
+        
+        assert result.success is False
+        assert "bad series" in result.error_message
+    
+    def test_predict_traffic_bursts_linear_trend(self, agent):
+        """Test the 24-hour forecast on a steadily increasing series."""
+        traffic_data = {
+            "time_series": [
+                {"timestamp": f"2024-01-{1 + hour // 24:02d}T{hour % 24:02d}:00:00Z", "value": 100 + hour}
+                for hour in range(48)
+            ]
+        }
+        
+        df = agent._build_traffic_frame(traffic_data["time_series"])
+        predictions, burst_probability = agent._predict_traffic_bursts(df)
+        
+        assert len(predictions) == 24
+        assert burst_probability.tolist() == [p["burst_probability"] for p in predictions]
+        # Trailing window mean is 135.5 and the slope is 1 req/s per hour
+        assert predictions[0]["predicted_value"] == pytest.approx(136.5)
+        assert predictions[-1]["predicted_value"] == pytest.approx(159.5)
+        # The whole forecast stays under 1.5x the history mean of 123.5
+        assert {p["scaling_recommendation"]["action"] for p in predictions} == {"no_action"}
+    
+    def test_analyze_traffic_patterns_string_timestamps(self, agent):
+        """Test hourly patterns are extracted from ISO timestamp strings."""
+        time_series = [
+            {"timestamp": f"2024-01-{1 + hour // 24:02d}T{hour % 24:02d}:00:00Z", "value": 500 if hour % 24 == 12 else 100}
+            for hour in range(48)
+        ]
+        
+        analysis = agent._analyze_traffic_patterns(agent._build_traffic_frame(time_series))
+        
+        assert "error" not in analysis
+        assert analysis["statistics"]["mean"] == pytest.approx((2 * 500 + 46 * 100) / 48)
+        assert analysis["statistics"]["min"] == 100
+        assert analysis["statistics"]["max"] == 500
+        assert analysis["patterns"]["peak_hours"] == [12]
+        assert analysis["patterns"]["daily_pattern"][12] == pytest.approx(500)
+    
+    def test_generate_recommendations_counts_high_burst_hours(self, agent):
+        """Test the proactive scaling recommendation counts hours above the threshold."""
+        recommendations = agent._generate_recommendations(np.array([0.2, 0.9, 0.9, 0.7]), {})
+        
+        assert len(recommendations) == 1
+        assert recommendations[0]["title"] == "Proactive Scaling Recommended"
+        assert "next 2 hours" in recommendations[0]["description"]
+    
+    def test_scaling_results_are_independent(self, agent):
+        """Test scaling actions follow the analysis and results do not share dicts."""
+        scaling_analysis = agent._analyze_scaling_config({})
+        actions = agent._generate_scaling_actions(scaling_analysis)
+        
+        assert [action["title"] for action in actions] == ["Optimize HPA Configuration"]
+        assert agent._generate_scaling_actions({"recommendations": []}) == []
+        
+        actions[0]["change"]["minReplicas"] = "decrease"
+        scaling_analysis["recommendations"][0]["priority"] = "low"
+        fresh = agent._analyze_scaling_config({})
+        assert fresh["recommendations"][0]["priority"] == "medium"
+        assert agent._generate_scaling_actions(fresh)[0]["change"]["minReplicas"] == "increase"
+        
+        analysis = {"patterns": {"daily_pattern": {12: 500.0}}, "statistics": {"volatility": 0.9}}
+        first = agent._generate_recommendations(np.array([0.1]), analysis)
+        second = agent._generate_recommendations(np.array([0.1]), analysis)
+        assert first == second
+        assert all(a is not b for a, b in zip(first, second))
+    
+    def test_build_traffic_frame_sorts_out_of_order_samples(self, agent, context):
+        """Test samples are put in time order before analysis."""
+        time_series = context.metrics_data["traffic"]["time_series"]
+        
+        df = agent._build_traffic_frame(time_series[::-1])
+        
+        assert df["value"].tolist() == [100, 150, 200]
+        assert df["hour"].tolist() == [10, 11, 12]
+    
+    def test_calculate_trend(self, agent):
+        """Test the trend is the least-squares slope per sample."""
+        df = agent._build_traffic_frame([
+            {"timestamp": f"2024-01-01T{hour:02d}:00:00Z", "value": 10 + 2.5 * hour + (hour % 2)}
+            for hour in range(12)
+        ])
+        
+        expected = np.polyfit(np.arange(12), df["value"].to_numpy(dtype=np.float64), 1)[0]
+        assert agent._calculate_trend(df) == pytest.approx(expected)
+    
+    def test_derive_traffic_reuses_last_result(self, agent, context):
+        """Test repeated analysis of the same series reuses the derived frame."""
+        time_series = context.metrics_data["traffic"]["time_series"]
+        
+        df, summary = agent._derive_traffic(time_series)
+        
+        assert agent._derive_traffic(list(time_series))[0] is df
+        assert summary[0] == pytest.approx(150)
+        
+        changed = time_series[:-1] + [{"timestamp": "2024-01-01T12:00:00Z", "value": 500}]
+        assert agent._derive_traffic(changed)[0] is not df
+        
+        # A revised interior sample is a different series
+        backfilled = [time_series[0], {**time_series[1], "value": 999}, time_series[2]]
+        df, summary = agent._derive_traffic(backfilled)
+        assert df["value"].tolist()[1] == 999
+        assert summary[3] == 999
+    
     @pytest.mark.asyncio
     async def test_optimize(self, agent, context):
         """Test optimization functionality."""
@@ -247,6 +371,170 @@ class TestCostWatcherAgent:
         assert "service_costs" in cost_data
         assert cost_data["total_cost"] > 0
     
+    @pytest.mark.asyncio
+    @patch('agents.cost_watcher.boto3.client')
+    async def test_fetch_aws_cost_data_uses_cache(self, mock_boto3, agent):
+        """Test repeated fetches reuse the processed Cost Explorer response."""
+        mock_ce_client = Mock()
+        mock_ce_client.get_cost_and_usage.return_value = {
+            'ResultsByTime': [
+                {
+                    'TimePeriod': {'Start': '2024-01-01', 'End': '2024-01-02'},
+                    'Total': {'UnblendedCost': {'Amount': '5.0'}},
+                    'Groups': []
+                }
+            ]
+        }
+        mock_boto3.return_value = mock_ce_client
+        agent.settings.aws_access_key_id = "test_key"
+        agent.settings.aws_secret_access_key = "test_secret"
+        
+        first = await agent._fetch_aws_cost_data()
+        second = await agent._fetch_aws_cost_data()
+        assert second is first
+        assert mock_ce_client.get_cost_and_usage.call_count == 1
+        
+        await agent._fetch_aws_cost_data(use_cache=False)
+        assert mock_ce_client.get_cost_and_usage.call_count == 2
+        
+        agent.clear_cache()
+        await agent._fetch_aws_cost_data()
+        assert mock_ce_client.get_cost_and_usage.call_count == 3
+        # The Cost Explorer client is built once and reused
+        assert mock_boto3.call_count == 1
+    
+    @patch('agents.cost_watcher.time.monotonic')
+    def test_cost_window_is_reused(self, mock_monotonic, agent):
+        """Test the query window is recomputed only after its TTL."""
+        mock_monotonic.return_value = 100.0
+        start_date, end_date = agent._cost_window()
+        assert (end_date - start_date).days == 30
+        
+        agent._cost_window_entry = (100.0, date(2024, 1, 1), date(2024, 1, 31))
+        mock_monotonic.return_value = 159.0
+        assert agent._cost_window() == (date(2024, 1, 1), date(2024, 1, 31))
+        
+        mock_monotonic.return_value = 160.0
+        assert agent._cost_window() == (start_date, end_date)
+    
+    @pytest.mark.asyncio
+    @patch('agents.cost_watcher.boto3.client')
+    async def test_fetch_aws_cost_data_coalesces_concurrent_calls(self, mock_boto3, agent):
+        """Test concurrent fetches of the same window share one Cost Explorer query."""
+        mock_ce_client = Mock()
+        mock_ce_client.get_cost_and_usage.return_value = {
+            'ResultsByTime': [
+                {
+                    'TimePeriod': {'Start': '2024-01-01', 'End': '2024-01-02'},
+                    'Total': {},
+                    'Groups': []
+                }
+            ]
+        }
+        mock_boto3.return_value = mock_ce_client
+        agent.settings.aws_access_key_id = "test_key"
+        agent.settings.aws_secret_access_key = "test_secret"
+        
+        results = await asyncio.gather(*(agent._fetch_aws_cost_data(use_cache=False) for _ in range(5)))
+        
+        assert all(result is results[0] for result in results)
+        assert mock_ce_client.get_cost_and_usage.call_count == 1
+        assert agent._inflight_fetches == {}
+    
+    @pytest.mark.asyncio
+    @patch('agents.cost_watcher.boto3.client')
+    async def test_fetch_aws_cost_data_paginates_and_drills_down(self, mock_boto3, agent):
+        """Test service pages are merged and only large services get a usage-type query."""
+        def service_group(service, amount):
+            return {'Keys': [service], 'Metrics': {'UnblendedCost': {'Amount': amount}}}
+        
+        period = {'Start': '2024-01-01', 'End': '2024-01-02'}
+        mock_ce_client = Mock()
+        mock_ce_client.get_cost_and_usage.side_effect = [
+            {
+                'ResultsByTime': [{'TimePeriod': period, 'Total': {}, 'Groups': [service_group('AmazonEC2', '40.0')]}],
+                'NextPageToken': 'page-2'
+            },
+            {
+                'ResultsByTime': [{'TimePeriod': period, 'Total': {}, 'Groups': [service_group('AmazonS3', '2.0')]}]
+            },
+            {
+                'ResultsByTime': [{'TimePeriod': period, 'Total': {}, 'Groups': [service_group('BoxUsage:m5.large', '40.0')]}]
+            }
+        ]
+        mock_boto3.return_value = mock_ce_client
+        agent.settings.aws_access_key_id = "test_key"
+        agent.settings.aws_secret_access_key = "test_secret"
+        
+        cost_data = await agent._fetch_aws_cost_data()
+        
+        assert cost_data["total_cost"] == pytest.approx(42.0)
+        assert cost_data["daily_costs"] == [{"date": "2024-01-01", "cost": 42.0}]
+        assert cost_data["service_costs"] == {"AmazonEC2": 40.0, "AmazonS3": 2.0}
+        assert cost_data["usage_costs"] == {"BoxUsage:m5.large": 40.0}
+        
+        calls = mock_ce_client.get_cost_and_usage.call_args_list
+        assert calls[1].kwargs["NextPageToken"] == "page-2"
+        assert calls[2].kwargs["Filter"] == {'Dimensions': {'Key': 'SERVICE', 'Values': ['AmazonEC2']}}
+        assert len(calls) == 3
+    
+    @pytest.mark.asyncio
+    @patch('agents.cost_watcher.asyncio.sleep', new_callable=AsyncMock)
+    @patch('agents.cost_watcher.boto3.client')
+    async def test_fetch_aws_cost_data_retries_throttled_page(self, mock_boto3, mock_sleep, agent):
+        """Test a throttled second page restarts the query instead of returning partial data."""
+        period = {'Start': '2024-01-01', 'End': '2024-01-02'}
+        page = {
+            'ResultsByTime': [{
+                'TimePeriod': period,
+                'Groups': [{'Keys': ['AmazonS3'], 'Metrics': {'UnblendedCost': {'Amount': '4.0'}}}]
+            }],
+            'NextPageToken': 'page-2'
+        }
+        last_page = {'ResultsByTime': []}
+        throttled = ClientError({'Error': {'Code': 'ThrottlingException'}}, 'GetCostAndUsage')
+        mock_ce_client = Mock()
+        mock_ce_client.get_cost_and_usage.side_effect = [page, throttled, page, last_page]
+        mock_boto3.return_value = mock_ce_client
+        agent.settings.aws_access_key_id = "test_key"
+        agent.settings.aws_secret_access_key = "test_secret"
+        
+        cost_data = await agent._fetch_aws_cost_data()
+        
+        assert cost_data["total_cost"] == pytest.approx(4.0)
+        assert mock_ce_client.get_cost_and_usage.call_count == 4
+        mock_sleep.assert_awaited_once_with(0.5)
+    
+    @pytest.mark.asyncio
+    @patch('agents.cost_watcher.asyncio.sleep', new_callable=AsyncMock)
+    async def test_fetch_usage_costs_retries_throttling(self, mock_sleep, agent):
+        """Test throttled drill-down queries back off and failures are skipped."""
+        throttled = ClientError({'Error': {'Code': 'ThrottlingException'}}, 'GetCostAndUsage')
+        denied = ClientError({'Error': {'Code': 'AccessDeniedException'}}, 'GetCostAndUsage')
+        usage = {
+            'ResultsByTime': [{
+                'Groups': [{'Keys': ['TimedStorage'], 'Metrics': {'UnblendedCost': {'Amount': '12.5'}}}]
+            }]
+        }
+        
+        def get_cost_and_usage(**params):
+            service = params['Filter']['Dimensions']['Values'][0]
+            if service == 'AmazonRDS':
+                raise denied
+            if mock_sleep.await_count == 0:
+                raise throttled
+            return usage
+        
+        mock_ce_client = Mock()
+        mock_ce_client.get_cost_and_usage.side_effect = get_cost_and_usage
+        
+        usage_costs = await agent._fetch_usage_costs(
+            mock_ce_client, {'Start': '2024-01-01', 'End': '2024-01-31'}, ['AmazonS3', 'AmazonRDS']
+        )
+        
+        assert usage_costs == {'TimedStorage': 12.5}
+        mock_sleep.assert_awaited_once_with(0.5)
+    
     def test_cost_pattern_analysis(self, agent, context):
         """Test cost pattern analysis."""
         cost_data = context.cost_data
@@ -255,8 +543,36 @@ class TestCostWatcherAgent:
         assert "total_cost" in analysis
         assert "avg_daily_cost" in analysis
         assert "top_services" in analysis
+        assert analysis["top_services"] == [("AmazonEC2", 80.0), ("AmazonRDS", 40.0), ("AmazonS3", 30.0)]
         assert "trend" in analysis
     
+    def test_cost_pattern_statistics(self, agent):
+        """Test daily cost statistics and the week-over-week trend."""
+        daily_costs = [{"date": f"2024-01-{day + 1:02d}", "cost": 5.0 if day < 7 else 8.0} for day in range(14)]
+        
+        analysis = agent._analyze_cost_patterns({"total_cost": 91.0, "daily_costs": daily_costs})
+        
+        assert analysis["avg_daily_cost"] == pytest.approx(6.5)
+        assert analysis["max_daily_cost"] == 8.0
+        assert analysis["min_daily_cost"] == 5.0
+        assert analysis["trend"] == "increasing"
+    
+    def test_current_spending_daily_average(self, agent, context):
+        """Test the spending summary averages the daily costs."""
+        assert agent._get_current_spending(context.cost_data)["daily_average"] == pytest.approx(5.25)
+        assert agent._get_current_spending({"total_cost": 0.0})["daily_average"] == 0.0
+    
+    def test_resource_utilization_overall_average(self, agent):
+        """Test overall utilization averages every EC2 and RDS utilization figure."""
+        utilization = agent._analyze_resource_utilization({
+            "ec2": [{"id": "i-1", "cpu_utilization": 0.1, "memory_utilization": 0.3}],
+            "rds": [{"id": "db-1", "cpu_utilization": 0.5, "storage_utilization": 0.7}]
+        })
+        
+        assert len(utilization["ec2_instances"]) == 1
+        assert len(utilization["rds_instances"]) == 1
+        assert utilization["overall_utilization"] == pytest.approx(0.4)
+    
     def test_optimization_opportunities(self, agent, context):
         """Test optimization opportunities identification."""
         cost_data = context.cost_data
@@ -265,6 +581,47 @@ class TestCostWatcherAgent:
         assert isinstance(opportunities, list)
         # Should find opportunities for EC2, RDS, and S3
         assert len(opportunities) > 0
+        assert [opp["service"] for opp in opportunities] == ["EC2", "S3", "RDS"]
+        assert opportunities[0]["potential_savings"] == pytest.approx(16.0)
+        
+        # Rules only look at per-service costs; a missing total does not hide them
+        ec2_cost = cost_data["service_costs"]["AmazonEC2"]
+        ec2_only = agent._identify_optimization_opportunities({"service_costs": {"AmazonEC2": ec2_cost}})
+        assert ec2_only == opportunities[:1]
+        assert agent._identify_optimization_opportunities({"service_costs": {}}) == []
+    
+    def test_cost_recommendation_titles(self, agent):
+        """Test opportunity recommendations get readable titles."""
+        opportunities = [
+            {"type": "idle_resources", "service": "EC2", "potential_savings": 50.0,
+             "description": "Idle", "priority": "medium"},
+            {"type": "custom", "service": "EKS", "potential_savings": 50.0,
+             "description": "Custom", "priority": "low"}
+        ]
+        recommendations = agent._generate_cost_recommendations({"total_cost": 0.0}, opportunities)
+        
+        assert [rec["title"] for rec in recommendations] == ["Idle Resources Opportunity", "custom Opportunity"]
+
+    def test_cost_recommendations_are_independent(self, agent):
+        """Test editing one cost recommendation leaves later results untouched."""
+        cost_analysis = {"total_cost": 0.0, "trend": "increasing"}
+        recommendations = agent._generate_cost_recommendations(cost_analysis, [])
+        recommendations[0]["priority"] = "high"
+        recommendations[0]["owner"] = "finops"
+    
+        fresh = agent._generate_cost_recommendations(cost_analysis, [])
+        assert fresh[0]["title"] == "Increasing Cost Trend"
+        assert fresh[0]["priority"] == "medium"
+        assert "owner" not in fresh[0]
+    
+    def test_instance_type_suggestions(self, agent):
+        """Test downsizing suggestions follow the utilization bands."""
+        assert agent._suggest_instance_type("m5.large", 0.1) == "t3.micro"
+        assert agent._suggest_instance_type("m5.large", 0.3) == "t3.small"
+        assert agent._suggest_instance_type("m5.large", 0.5) == "m5.large"
+        assert agent._suggest_instance_type("t3.medium", 0.1) == "t3.medium"
+        assert agent._suggest_rds_instance_type("db.m5.large", 0.1) == "db.t3.micro"
+        assert agent._suggest_rds_instance_type("db.m5.large", 0.3) == "db.t3.small"
 
 
 class TestAnomalyDetectorAgent:
@@ -353,16 +710,166 @@ class TestAnomalyDetectorAgent:
             assert "severity" in anomaly
             assert "z_score" in anomaly
     
+    def test_anomaly_detection_long_series(self, agent):
+        """Test anomaly detection over a series long enough to be scored."""
+        values = [50, 52, 51, 49, 50, 53, 48, 51, 50, 52, 49, 50, 120, 51, 50]
+        metrics_data = {
+            "cpu_utilization": [
+                {"value": value, "timestamp": f"2024-01-01T{hour:02d}:00:00Z"}
+                for hour, value in enumerate(values)
+            ]
+        }
+        
+        anomalies = agent._detect_anomalies(metrics_data)
+        
+        assert len(anomalies) == 1
+        assert anomalies[0]["value"] == 120
+        assert anomalies[0]["timestamp"] == "2024-01-01T12:00:00Z"
+        assert anomalies[0]["severity"] == "high"
+    
+    def test_anomaly_detection_trending_series(self, agent):
+        """Test that the change-point baseline catches spikes on a long trending metric."""
+        values = [10.0 + hour for hour in range(100)]
+        values[80] += 15
+        metrics_data = {
+            "requests_per_second": [
+                {"value": value, "timestamp": hour}
+                for hour, value in enumerate(values)
+            ]
+        }
+        
+        anomalies = agent._detect_anomalies(metrics_data)
+        
+        assert [a["timestamp"] for a in anomalies] == [80]
+    
+    def test_anomaly_detection_short_trending_series(self, agent):
+        """Test that series below the BOCPD cutoff are judged against a rolling baseline."""
+        # 45 samples: longer than the 30-sample window, shorter than BOCPD's 50
+        values = [10.0 + hour for hour in range(45)]
+        values[35] += 12  # Within two global deviations, but far above the recent level
+        metrics_data = {
+            "requests_per_second": [
+                {"value": value, "timestamp": hour}
+                for hour, value in enumerate(values)
+            ]
+        }
+        
+        with patch.object(agent, "_rolling_baseline", wraps=agent._rolling_baseline) as rolling, \
+             patch.object(agent, "_change_point_baseline") as change_point:
+            anomalies = agent._detect_anomalies(metrics_data)
+        
+        rolling.assert_called_once()
+        change_point.assert_not_called()
+        assert [a["timestamp"] for a in anomalies] == [35]
+    
+    def test_concurrent_scans_do_not_share_scratch(self, agent):
+        """Test scans on several threads at once each get correct results."""
+        rng = np.random.default_rng(2)
+        inputs = []
+        for shift in range(4):
+            values = rng.normal(50 + 10 * shift, 2, 40)
+            values[10 + shift] += 30
+            inputs.append({"latency_ms": [{"value": v, "timestamp": i} for i, v in enumerate(values)]})
+        expected = [agent._detect_anomalies(metrics) for metrics in inputs]
+        
+        results = [None] * len(inputs)
+        barrier = threading.Barrier(len(inputs))
+        
+        def scan(index):
+            barrier.wait()
+            for _ in range(20):
+                results[index] = agent._detect_anomalies(inputs[index])
+        
+        workers = [threading.Thread(target=scan, args=(index,)) for index in range(len(inputs))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert results == expected
+    
+    def test_anomaly_detection_level_shift(self, agent):
+        """Test that long series re-baseline after a change point."""
+        rng = np.random.default_rng(0)
+        values = np.concatenate([rng.normal(50, 2, 300), rng.normal(80, 2, 300)])
+        values[100] = 70
+        values[450] = 60
+        metrics_data = {
+            "latency_ms": [
+                {"value": float(value), "timestamp": i}
+                for i, value in enumerate(values)
+            ]
+        }
+        
+        anomalies = agent._detect_anomalies(metrics_data)
+        
+        # The spikes and the shift itself are flagged, the new regime is not
+        assert [a["timestamp"] for a in anomalies] == [100, 300, 450]
+    
+    def test_anomaly_detection_array_layout(self, agent):
+        """Test that parallel-array metrics match the list-of-samples layout."""
+        values = [50, 52, 51, 49, 50, 53, 48, 51, 50, 52, 49, 50, 120, 51, 50]
+        timestamps = [f"2024-01-01T{hour:02d}:00:00Z" for hour in range(len(values))]
+        
+        from_arrays = agent._detect_anomalies({
+            "cpu_utilization": {"values": np.array(values), "timestamps": timestamps}
+        })
+        from_samples = agent._detect_anomalies({
+            "cpu_utilization": [
+                {"value": value, "timestamp": timestamp}
+                for value, timestamp in zip(values, timestamps)
+            ]
+        })
+        
+        assert from_arrays == from_samples
+        assert from_arrays[0]["timestamp"] == "2024-01-01T12:00:00Z"
+    
     def test_anomaly_recommendations(self, agent, context):
         """Test anomaly recommendation generation."""
         metrics_data = context.metrics_data
-        anomalies = agent._detect_anomalies(metrics_data)
-        recommendations = agent._generate_anomaly_recommendations(anomalies)
+        anomalies, high_count, medium_count = agent._scan_metrics(metrics_data)
+        recommendations = agent._generate_anomaly_recommendations(high_count, medium_count)
         
         assert isinstance(recommendations, list)
+        assert high_count + medium_count == len(anomalies)
         if anomalies:
             assert len(recommendations) > 0
     
+    @pytest.mark.asyncio
+    async def test_execute_combines_results(self, agent, context):
+        """Test that execute merges analysis and optimization output."""
+        result = await agent.execute(context)
+        
+        assert result.success is True
+        assert "anomalies" in result.data["analysis"]
+        assert "alerting_analysis" in result.data["optimization"]
+        assert len(result.actions) > 0
+    
+    def test_alerting_results_are_independent(self, agent):
+        """Test editing one alerting result leaves later results untouched."""
+        actions = agent._generate_alerting_actions({})
+        actions[0]["change"]["severity"] = "high"
+        actions.append({})
+        
+        analysis = agent._analyze_alerting_config({})
+        analysis["recommendations"][0]["priority"] = "low"
+        
+        fresh = agent._generate_alerting_actions({})
+        assert len(fresh) == 1
+        assert fresh[0]["change"]["severity"] == "medium"
+        assert agent._analyze_alerting_config({})["recommendations"][0]["priority"] == "medium"
+    
+    @pytest.mark.asyncio
+    async def test_execute_reports_analysis_failure(self, agent, context):
+        """Test that an exception raised during analysis fails the execution."""
+        with patch.object(agent, "analyze", AsyncMock(side_effect=RuntimeError("boom"))):
+            result = await agent.execute(context)
+        
+        assert result.success is False
+        assert result.error_message == "boom"
+        assert agent.error_count == 1
+        assert agent.status.value == "error"
+    
     def test_agent_performance_tracking(self, agent):
         """Test agent performance tracking."""
         # Simulate execution
@@ -377,6 +884,291 @@ class TestAnomalyDetectorAgent:
         assert agent.avg_execution_time == 4.25  # (15 + 2) / 4
 
 
+class TestPlaceholderAgents:
+    """Test suite for agents that return fixed results."""
+    
+    @pytest.fixture
+    def agent(self):
+        """Create an AutoScalerAdvisor agent instance."""
+        settings = Settings()
+        return AutoScalerAdvisorAgent(settings)
+    
+    @pytest.fixture
+    def context(self):
+        """Create an empty test context."""
+        return AgentContext(
+            infrastructure_data={},
+            metrics_data={},
+            cost_data={},
+            security_data={},
+            user_preferences={},
+            execution_id="test_execution",
+            timestamp=datetime.now().timestamp()
+        )
+    
+    @pytest.mark.asyncio
+    async def test_execute_merges_into_fresh_lists(self, agent, context):
+        """Test that execute never hands out the shared result containers."""
+        first = await agent.execute(context)
+        first.recommendations.append({"title": "Local change"})
+        second = await agent.execute(context)
+        
+        assert first.success is True
+        assert isinstance(second.recommendations, list)
+        assert isinstance(second.actions, list)
+        assert second.recommendations == []
+        assert second.data == {"analysis": {"hpa_analysis": {}}, "optimization": {"hpa_optimization": {}}}
+    
+    @pytest.mark.asyncio
+    async def test_capacity_planner_results_are_independent(self, context):
+        """Test the capacity planner hands out fresh result containers."""
+        agent = CapacityPlannerAgent(Settings())
+        
+        analysis = await agent.analyze(context)
+        analysis.data["capacity_analysis"]["edited"] = True
+        analysis.recommendations.append({"title": "Local change"})
+        
+        again = await agent.analyze(context)
+        assert again.data == {"capacity_analysis": {}}
+        assert again.recommendations == []
+        assert (await agent.optimize(context)).data == {"capacity_optimization": {}}
+    
+    @pytest.mark.asyncio
+    async def test_load_shifter_results_are_independent(self, context):
+        """Test the load shifter hands out fresh result containers."""
+        agent = LoadShifterAgent(Settings())
+        
+        optimization = await agent.optimize(context)
+        optimization.data["load_optimization"]["edited"] = True
+        optimization.actions.append({"title": "Local change"})
+        
+        again = await agent.optimize(context)
+        assert again.data == {"load_optimization": {}}
+        assert again.actions == []
+        assert (await agent.analyze(context)).data == {"load_analysis": {}}
+
+
+class TestAgentRegistry:
+    """Test suite for the agent registry."""
+    
+    @pytest.fixture
+    def registry(self):
+        """Create an agent registry with the built-in agents."""
+        return AgentRegistry(Settings())
+    
+    @pytest.mark.asyncio
+    async def test_create_initializes_agents_concurrently(self, registry):
+        """Test the async factory builds the same agents as the constructor."""
+        created = await AgentRegistry.create(Settings())
+        
+        assert list(created.agents) == list(registry.agents)
+        assert [agent.name for agent in created.list_enabled_agents()] == list(created.agents)
+        assert created.agent_classes[AgentType.BURST_PREDICTOR] is BurstPredictorAgent
+    
+    def test_views_are_cached_until_registry_changes(self, registry):
+        """Test listings are reused within the TTL and rebuilt after a change."""
+        agents = registry.list_agents()
+        health = registry.get_overall_health()
+        assert registry.list_agents() is agents
+        assert registry.get_overall_health() is health
+        
+        name = agents[0]["name"]
+        assert registry.disable_agent(name)
+        
+        assert registry.list_agents()[0]["enabled"] is False
+        assert registry.get_overall_health()["enabled_agents"] == health["enabled_agents"] - 1
+    
+    def test_overall_health_summary_counts(self, registry):
+        """Test the summary matches the full health report's counts."""
+        agent = registry.list_enabled_agents()[0]
+        registry.disable_agent(registry.list_enabled_agents()[1].name)
+        agent.status = AgentStatus.ERROR
+        
+        summary = registry.get_overall_health_summary()
+        health = registry.get_overall_health()
+        
+        assert summary == {key: health[key] for key in summary}
+        assert summary["healthy_agents"] == summary["enabled_agents"] - 1
+    
+    def test_enabled_agents_follow_registry_changes(self, registry):
+        """Test the enabled index tracks enable, disable, register and unregister."""
+        agent = registry.list_enabled_agents()[0]
+        total = len(registry.agents)
+        
+        registry.disable_agent(agent.name)
+        assert agent not in registry.list_enabled_agents()
+        assert len(registry.list_enabled_agents()) == total - 1
+        
+        registry.enable_agent(agent.name)
+        assert agent in registry.list_enabled_agents()
+        
+        registry.unregister_agent(agent.name)
+        assert agent not in registry.list_enabled_agents()
+        
+        registry.register_agent(agent)
+        assert agent in registry.list_enabled_agents()
+    
+    @pytest.mark.asyncio
+    async def test_execute_all_agents_isolates_failures(self, registry):
+        """Test an agent raising outside its own error handling only fails itself."""
+        agent_names = [agent.name for agent in registry.list_enabled_agents()]
+        broken = registry.agents[agent_names[0]]
+        broken.validate_context = AsyncMock(side_effect=RuntimeError("boom"))
+        
+        results = await registry.execute_all_agents({})
+        
+        assert set(results) == set(agent_names)
+        assert results[broken.name].success is False
+        assert results[broken.name].error_message == "Agent execution failed: boom"
+    
+    @pytest.mark.asyncio
+    async def test_execute_all_agents_respects_concurrency_limit(self, registry):
+        """Test batches never run more agents at once than the current limit."""
+        await registry.set_max_concurrent(2)
+        running = 0
+        peak = 0
+        
+        async def execute_with_context(agent, context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        registry._execute_with_context = execute_with_context
+        results = await registry.execute_all_agents({})
+        
+        assert len(results) == len(registry.list_enabled_agents())
+        assert peak == 2
+        assert registry._in_flight == 0
+        
+        with pytest.raises(ValueError):
+            await registry.set_max_concurrent(0)
+    
+    def test_admission_works_across_event_loops(self, registry):
+        """Test a registry built outside a loop can be driven by several loops."""
+        async def execute_with_context(agent, context):
+            await asyncio.sleep(0.001)
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        async def run_batch():
+            await registry.set_max_concurrent(1)
+            return await registry.execute_all_agents({})
+        
+        registry._execute_with_context = execute_with_context
+        for _ in range(2):
+            results = asyncio.run(run_batch())
+            assert all(result.success for result in results.values())
+        
+        assert registry._in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_execute_all_agents_shares_context_data(self, registry):
+        """Test every agent gets the batch's data under its own execution id."""
+        contexts = {}
+        
+        async def execute_with_context(agent, context):
+            contexts[agent.name] = context
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        registry._execute_with_context = execute_with_context
+        metrics = {"cpu": [1, 2, 3]}
+        await registry.execute_all_agents({"metrics": metrics})
+        
+        assert len({context.execution_id for context in contexts.values()}) == len(contexts)
+        assert all(context.metrics_data is metrics for context in contexts.values())
+        assert all(context.execution_id.startswith(name) for name, context in contexts.items())
+    
+    @pytest.mark.asyncio
+    async def test_iter_execute_all_agents_streams_in_completion_order(self, registry):
+        """Test fast agents are delivered before slow ones finish."""
+        slow = registry.list_enabled_agents()[0].name
+        
+        async def execute_with_context(agent, context):
+            await asyncio.sleep(0.05 if agent.name == slow else 0)
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        registry._execute_with_context = execute_with_context
+        names = [name async for name, result in registry.iter_execute_all_agents({})]
+        
+        assert names[-1] == slow
+        assert sorted(names) == sorted(agent.name for agent in registry.list_enabled_agents())
+    
+    @pytest.mark.asyncio
+    async def test_blocking_agents_run_on_thread_pool(self, registry):
+        """Test agents flagged as blocking execute off the event loop thread."""
+        agent = registry.agents["anomaly_detector"]
+        assert agent.is_blocking
+        threads = []
+        
+        async def execute(context):
+            threads.append(threading.current_thread().name)
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        agent.execute = execute
+        result = await registry.execute_agent(agent.name, {"metrics": {"cpu": []}})
+        
+        assert result.success
+        assert threads[0].startswith("agent")
+    
+    @pytest.mark.asyncio
+    async def test_execute_all_agents_caps_outstanding_tasks(self, registry):
+        """Test no more than agent_batch_size agent tasks exist at once."""
+        registry.settings.agent_batch_size = 3
+        running = 0
+        peak = 0
+        
+        async def execute_with_context(agent, context):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        registry._execute_with_context = execute_with_context
+        results = await registry.execute_all_agents({})
+        
+        assert len(results) == len(registry.list_enabled_agents())
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_execute_agent_timeout_covers_validation(self, registry):
+        """Test a hung context validator is cut off by the agent timeout."""
+        registry.settings.agent_timeout = 0.01
+        agent = registry.list_enabled_agents()[0]
+        
+        async def hang(context):
+            await asyncio.sleep(10)
+        
+        agent.validate_context = hang
+        result = await registry.execute_agent(agent.name, {})
+        
+        assert result.success is False
+        assert "timed out" in result.error_message
+    
+    @pytest.mark.asyncio
+    async def test_execute_all_agents_bounds_batch(self, registry):
+        """Test stragglers are cancelled and reported once the batch times out."""
+        registry.settings.agent_timeout = 0
+        registry.settings.agent_batch_grace_period = 0.01
+        stuck = registry.list_enabled_agents()[0].name
+        
+        async def execute_with_context(agent, context):
+            if agent.name == stuck:
+                await asyncio.sleep(10)
+            return AgentResult(success=True, data={}, recommendations=[], actions=[])
+        
+        registry._execute_with_context = execute_with_context
+        results = await registry.execute_all_agents({})
+        
+        assert results[stuck].success is False
+        assert "timed out" in results[stuck].error_message
+        assert all(result.success for name, result in results.items() if name != stuck)
+        assert registry._in_flight == 0
+
+
 class TestAgentContextValidation:
     """Test suite for agent context validation."""
     
@@ -413,6 +1205,21 @@ class TestAgentContextValidation:
         
         for field in required_fields:
             assert hasattr(context, field)
+    
+    def test_context_is_immutable(self):
+        """Test that contexts cannot be modified once built."""
+        context = AgentContext(
+            infrastructure_data={},
+            metrics_data={},
+            cost_data={},
+            security_data={},
+            user_preferences={},
+            execution_id="test",
+            timestamp=datetime.now().timestamp()
+        )
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.execution_id = "other"
 
 
 class TestAgentResult:
@@ -449,6 +1256,60 @@ class TestAgentResult:
         assert result.success is False
         assert result.error_message == "Test error"
         assert result.execution_time == 0.5
+    
+    def test_result_to_json(self):
+        """Test JSON serialization of agent results."""
+        result = AgentResult(
+            success=True,
+            data={"anomalies": [{"z_score": np.float64(3.5), "count": np.int64(2)}]},
+            recommendations=[{"title": "Test"}],
+            actions=(),
+            execution_time=0.25
+        )
+        
+        payload = json.loads(result.to_json())
+        
+        assert payload["success"] is True
+        assert payload["data"]["anomalies"][0] == {"z_score": 3.5, "count": 2}
+        assert payload["recommendations"] == [{"title": "Test"}]
+        assert payload["actions"] == []
+        assert payload["error_message"] is None
+
+
+class TestKernels:
+    """Test suite for the numeric kernels."""
+    
+    def test_kernels_load_numba_lazily(self):
+        """Test importing agents skips Numba and each agent compiles only its own kernels."""
+        script = (
+            "import sys\n"
+            "import agents.burst_predictor, agents.anomaly_detector\n"
+            "from agents import kernels\n"
+            "assert 'numba' not in sys.modules\n"
+            "from agents.anomaly_detector import AnomalyDetectorAgent\n"
+            "from core.config import Settings\n"
+            "AnomalyDetectorAgent(Settings())\n"
+            "assert kernels.zscore_outliers._impl is not None\n"
+            "assert kernels.burst_forecast._impl is None\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", script], check=True, cwd=repo_root)
+    
+    def test_numpy_fallbacks_match_kernels(self):
+        """Test the NumPy fallbacks agree with the kernels actually in use."""
+        rng = np.random.default_rng(1)
+        traffic = rng.normal(100, 10, 60).astype(np.float32)
+        
+        for kernel, args in (
+            (kernels.summary_stats, (traffic,)),
+            (kernels.mean_slope, (traffic,)),
+            (kernels.burst_forecast, (traffic, 100.0, 10.0, 24, 6)),
+            (kernels.bocpd_baseline, (traffic, 100.0, 1.0, 1.0, 100.0, 0.01, 1e-4)),
+        ):
+            expected = kernel._numpy_impl(*args)
+            actual = kernel(*args)
+            for want, got in zip(expected, actual):
+                np.testing.assert_allclose(got, want, rtol=1e-5)
 
 
 if __name__ == "__main__":
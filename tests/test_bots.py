@@ -7,10 +7,11 @@ Telegram bot, and Slack bot implementations.
 
 import pytest
 import asyncio
+from collections import deque
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
-from bots.gateway import BotGateway
+from bots.gateway import BotGateway, format_alert
 from bots.telegram_bot import TelegramBot
 from bots.slack_bot import SlackBot
 from core.config import Settings
@@ -116,6 +117,21 @@ class TestBotGateway:
         assert "Agents" in response
         assert "Overall Health" in response
     
+    @pytest.mark.asyncio
+    async def test_status_snapshot_is_cached(self, gateway, agent_registry):
+        """Test repeated /status calls within the TTL reuse one registry read."""
+        await gateway._handle_status_command()
+        await gateway._handle_status_command()
+        
+        assert agent_registry.list_agents.call_count == 1
+        assert agent_registry.get_overall_health.call_count == 1
+        
+        # An expired snapshot is refreshed
+        gateway.settings.status_cache_ttl = 0
+        await gateway._handle_status_command()
+        
+        assert agent_registry.list_agents.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_handle_cost_command(self, gateway):
         """Test handling /cost command."""
@@ -155,6 +171,25 @@ class TestBotGateway:
         assert "AI Analysis Results" in response
         assert "Test Recommendation" in response
     
+    @pytest.mark.asyncio
+    async def test_handle_analysis_command_skips_raising_agent(self, gateway):
+        """Test one agent raising does not hide the others' results."""
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.recommendations = [{"title": "Test Recommendation"}]
+        
+        async def execute_agent(agent_name, context_data):
+            if agent_name == "anomaly_detector":
+                raise RuntimeError("boom")
+            return mock_result
+        
+        gateway.agent_registry.execute_agent = execute_agent
+        
+        response = await gateway._handle_analysis_command()
+        
+        assert "Burst Predictor" in response
+        assert "Anomaly Detector" not in response
+    
     @pytest.mark.asyncio
     async def test_handle_anomaly_command(self, gateway):
         """Test handling /anomaly command."""
@@ -291,6 +326,14 @@ class TestBotGateway:
         response = await gateway.handle_command("telegram", "user123", "/unknown")
         assert "Unknown command" in response
         assert "/help" in response
+        
+        # Arguments are split off the command text
+        response = await gateway.handle_command("telegram", "user123", "/scale api 5")
+        assert "Scaled api to 5 replicas" in response
+        
+        # Only whole command names match
+        response = await gateway.handle_command("telegram", "user123", "/agents")
+        assert "Unknown command" in response
     
     @pytest.mark.asyncio
     async def test_send_alert(self, gateway):
@@ -318,7 +361,27 @@ class TestBotGateway:
             
             # Verify alerts were sent
             mock_telegram_instance.send_message.assert_called_once()
-            mock_slack_instance.send_message.assert_called_once()
+            mock_slack_instance.queue_message.assert_called_once()
+    
+    def test_format_alert(self):
+        """Test alerts are prefixed with their priority indicator."""
+        assert format_alert("high", "disk full") == "🚨 disk full"
+        assert format_alert("critical", "disk full", "*ALERT*") == "🔥 *ALERT*: disk full"
+        assert format_alert("unknown", "disk full") == "⚠️ disk full"
+    
+    @pytest.mark.asyncio
+    async def test_send_alert_survives_channel_failure(self, gateway):
+        """Test one failing channel does not stop delivery to the other."""
+        gateway.settings.telegram_chat_id = "chat123"
+        gateway.telegram_bot = AsyncMock()
+        gateway.telegram_bot.send_message.side_effect = RuntimeError("telegram down")
+        gateway.slack_bot = AsyncMock()
+        
+        await gateway.send_alert("Test alert message", "critical")
+        
+        gateway.slack_bot.queue_message.assert_called_once_with(
+            gateway.settings.slack_channel, "🔥 Test alert message"
+        )
     
     def test_command_history_tracking(self, gateway):
         """Test command history tracking."""
@@ -334,6 +397,33 @@ class TestBotGateway:
         assert len(gateway.command_history) == 1
         assert gateway.command_history[0]["command"] == "/status"
         assert gateway.command_history[0]["user_id"] == "user123"
+    
+    @pytest.mark.asyncio
+    async def test_command_history_is_bounded(self, gateway):
+        """Test only the most recent commands are kept."""
+        gateway.command_history = deque(maxlen=2)
+        
+        for command in ("/help", "/alerts", "/status"):
+            await gateway.handle_command("slack", "user123", command)
+        
+        assert [record["command"] for record in gateway.command_history] == ["/alerts", "/status"]
+        assert gateway.command_history[-1]["bot_type"] == "slack"
+    
+    @pytest.mark.asyncio
+    async def test_command_audit_is_deferred_while_running(self, gateway):
+        """Test a running gateway records commands off the reply path."""
+        gateway._audit_queue = asyncio.Queue()
+        
+        await gateway.handle_command("slack", "user123", "/help")
+        
+        assert len(gateway.command_history) == 0
+        assert gateway._audit_queue.qsize() == 1
+        
+        # Stopping records anything still queued
+        await gateway._stop_audit_worker()
+        
+        assert [record["command"] for record in gateway.command_history] == ["/help"]
+        assert gateway._audit_queue is None
 
 
 class TestTelegramBot:
@@ -527,6 +617,68 @@ class TestSlackBot:
             assert slack_bot.running is False
             mock_socket_client.stop.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_stop_closes_http_session(self, slack_bot):
+        """Test stopping the bot closes its shared HTTP session."""
+        session = AsyncMock()
+        slack_bot._session = session
+        slack_bot.running = True
+        
+        await slack_bot.stop()
+        
+        session.close.assert_awaited_once()
+        assert slack_bot._session is None
+        assert slack_bot.client is not None
+        assert slack_bot.client.session is None
+    
+    @pytest.mark.asyncio
+    async def test_failed_start_closes_http_session(self, slack_bot):
+        """Test a socket client that fails to start does not leak the HTTP session."""
+        session = AsyncMock()
+        with patch('bots.slack_bot.aiohttp.ClientSession', return_value=session), \
+                patch('bots.slack_bot.AsyncBaseSocketModeClient') as mock_socket:
+            mock_socket.return_value.socket_mode_request_listeners = []
+            mock_socket.return_value.start = AsyncMock(side_effect=ConnectionError("refused"))
+            
+            with pytest.raises(ConnectionError):
+                await slack_bot.start()
+        
+        session.close.assert_awaited_once()
+        assert slack_bot._session is None
+        assert slack_bot.running is False
+    
+    @pytest.mark.asyncio
+    async def test_alerts_are_coalesced_per_channel(self, slack_bot):
+        """Test alerts queued while running are posted as one message per channel."""
+        slack_bot.running = True
+        
+        with patch.object(slack_bot, '_send_message') as mock_send:
+            await slack_bot.send_alert("channel123", "first", "high")
+            await slack_bot.send_alert("channel123", "second", "low")
+            await slack_bot.send_alert("channel456", "third", "high")
+            
+            mock_send.assert_not_called()
+            
+            # One delayed flush delivers the whole burst and then retires
+            await slack_bot._flush_task
+            
+            assert slack_bot._flush_task is None
+            assert mock_send.call_count == 2
+            mock_send.assert_any_call("channel123", "🚨 *ALERT*: first\nℹ️ *ALERT*: second")
+            mock_send.assert_any_call("channel456", "🚨 *ALERT*: third")
+    
+    @pytest.mark.asyncio
+    async def test_stop_delivers_queued_alerts(self, slack_bot):
+        """Test stopping waits for the pending flush instead of dropping it."""
+        slack_bot.running = True
+        
+        with patch.object(slack_bot, '_send_message') as mock_send:
+            await slack_bot.send_alert("channel123", "first", "high")
+            await slack_bot.stop()
+            
+            mock_send.assert_called_once_with("channel123", "🚨 *ALERT*: first")
+            assert slack_bot._flush_task is None
+    
     @pytest.mark.asyncio
     async def test_handle_socket_request(self, slack_bot):
         """Test handling socket requests."""